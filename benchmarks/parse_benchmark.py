@@ -0,0 +1,101 @@
+"""Per-page parse time and peak memory of the listing and article parsers.
+
+Runs every available backend against the saved gktoday pages in
+benchmarks/fixtures and compares them with the original full-page
+html.parser parse. Peak memory is measured with tracemalloc, so it covers
+Python allocations only; lxml and selectolax keep their trees in C memory.
+Quiz extraction is checked before timing starts against gktoday_quiz.html,
+a synthetic page built from the article fixture in gktoday's quiz layout;
+it covers the answer and notes formats extract_quiz handles, not every
+variation a live quiz page may use.
+
+Usage: python benchmarks/parse_benchmark.py [--iterations N]
+"""
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+import main
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SOURCE = main.SOURCES['gktoday']
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as file:
+        return file.read()
+
+def check_quiz_extraction():
+    with open(os.path.join(FIXTURES_DIR, 'gktoday_quiz_expected.json'), encoding='utf-8') as file:
+        expected = json.load(file)
+    for parser in ['html.parser'] + (['lxml'] if importlib.util.find_spec('lxml') else []):
+        quiz = main.extract_quiz(SOURCE.parse_article(load_fixture('gktoday_quiz.html'), parser))
+        if quiz != expected:
+            raise AssertionError(f"Quiz extracted with {parser} does not match gktoday_quiz_expected.json")
+
+def full_parse_listing(content, parser):
+    soup = BeautifulSoup(content, parser)
+    return [a_tag['href'] for h1_tag in soup.find_all('h1', id='list')
+            if (a_tag := h1_tag.find('a')) and a_tag.get('href')]
+
+def full_parse_article(content, parser):
+    return SOURCE.extract_article(BeautifulSoup(content, parser))
+
+def available_cases():
+    parsers = ['html.parser'] + (['lxml'] if importlib.util.find_spec('lxml') else [])
+    cases = []
+    for parser in parsers:
+        cases.append(('listing', f"{parser} full page", lambda content, parser=parser: full_parse_listing(content, parser)))
+        cases.append(('listing', f"{parser} strained", lambda content, parser=parser: SOURCE.extract_listing_urls(content, 'bs4', parser)))
+    if main.LexborHTMLParser:
+        cases.append(('listing', "selectolax", lambda content: SOURCE.extract_listing_urls(content, 'selectolax')))
+    for parser in parsers:
+        cases.append(('article', f"{parser} full page", lambda content, parser=parser: full_parse_article(content, parser)))
+        cases.append(('article', f"{parser} strained", lambda content, parser=parser: SOURCE.parse_article(content, parser)))
+    return cases
+
+def measure(func, content, iterations):
+    func(content)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(content)
+    elapsed = (time.perf_counter() - start) / iterations
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def run(iterations):
+    logging.disable(logging.CRITICAL)
+    check_quiz_extraction()
+    pages = {
+        'listing': load_fixture('gktoday_listing.html'),
+        'article': load_fixture('gktoday_article.html')
+    }
+    baselines = {}
+    expected = {}
+    print(f"{'page':<8} {'backend':<22} {'ms/page':>9} {'peak KiB':>9} {'speedup':>8}")
+    for page, name, func in available_cases():
+        content = pages[page]
+        result = func(content)
+        if page not in expected:
+            expected[page] = result
+        elif result != expected[page]:
+            raise AssertionError(f"{name} returned a different result for the {page} page")
+        elapsed, peak = measure(func, content, iterations)
+        baselines.setdefault(page, elapsed)
+        print(f"{page:<8} {name:<22} {elapsed * 1000:>9.2f} {peak / 1024:>9.0f} {baselines[page] / elapsed:>7.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark HTML parsing backends on saved gktoday pages")
+    parser.add_argument('--iterations', type=int, default=50, help="parses per backend and page")
+    run(parser.parse_args().iterations)
@@ -0,0 +1,368 @@
+"""End-to-end pipeline throughput with in-process stand-ins for every external service.
+
+Runs N copies of the saved gktoday article through the real ArticlePipeline,
+translator batching, image encoding, NewsWriter and notification queue, while
+HTTP, Google Translate, FTP, MySQL, MongoDB and FCM are replaced by fakes that
+only sleep for a configurable latency. Each article gets its own URL, image and
+text so the caches and dedup indexes behave as on a run of fresh articles.
+
+Reports articles/s, p50/p95 per-article latency (first fetch claim to notify)
+and the p50 of every stage, plus peak RSS. With --trace-memory the peak of
+Python allocations is measured with tracemalloc as well, which slows the run.
+
+Usage: python benchmarks/pipeline_benchmark.py [--articles N] [--workers "translate=8,image=4"]
+"""
+import argparse
+import asyncio
+import io
+import logging
+import os
+import random
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+import main
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+ARTICLE_URL = "https://www.gktoday.in/benchmark-article-{}/"
+FIXTURE_IMAGE_NAME = 'eos-09.jpg'
+# Latin letters are mapped into the Gujarati block so translated text has a realistic UTF-8 size
+GUJARATI_TABLE = str.maketrans({chr(ord('a') + i): chr(0x0A95 + i) for i in range(26)})
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as file:
+        return file.read()
+
+def make_jpeg(width=1600, height=900):
+    img = Image.effect_noise((width // 4, height // 4), 64).resize((width, height)).convert('RGB')
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=90)
+    return buffer.getvalue()
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+class FakeSession:
+    def __init__(self, image, latency):
+        self.image = image
+        self.latency = latency
+
+    def get(self, url, timeout=None, stream=False):
+        time.sleep(self.latency)
+        # Bytes after the JPEG end marker are ignored by decoders but give every URL its own content hash
+        return FakeResponse(self.image + url.encode())
+
+class FakeHttpClient:
+    """Serves the article fixture for every URL, varied per article so no two pages share text or images."""
+
+    def __init__(self, page, image, latency):
+        self.page = page.decode('utf-8')
+        self.latency = latency
+        self.session = FakeSession(image, latency)
+
+    def has_cached(self, url):
+        return False
+
+    def get_page(self, url, prefer_cache=False):
+        time.sleep(self.latency)
+        number = re.search(r'(\d+)/$', url).group(1)
+        page = self.page.replace(FIXTURE_IMAGE_NAME, f"eos-09-{number}.jpg")
+        page = page.replace('<h1 id="list">', f'<h1 id="list">{number} ')
+        # Shuffled words keep the length and vocabulary but make every article distinct to the near-duplicate check
+        shuffle = random.Random(number).shuffle
+
+        def shuffle_words(match):
+            words = match.group(2).split()
+            shuffle(words)
+            return f"<{match.group(1)}>{' '.join(words)}</{match.group(1)}>"
+
+        page = re.sub(r'<(p|li)>([^<]*)</\1>', shuffle_words, page)
+        main.metrics.increment('bytes_downloaded', len(page), kind='page')
+        return main.CachedResponse(url, page.encode('utf-8'), 'text/html; charset=UTF-8')
+
+class FakeTranslator:
+    latency = 0.0
+    error_rate = 0.0
+    calls = 0
+
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+        self.random = random.Random(0)
+
+    def translate(self, text):
+        FakeTranslator.calls += 1
+        time.sleep(FakeTranslator.latency)
+        if self.random.random() < FakeTranslator.error_rate:
+            raise ConnectionError("simulated translation failure")
+        return text.lower().translate(GUJARATI_TABLE)
+
+class FakeFtpPool:
+    def __init__(self, latency):
+        self.latency = latency
+        self.uploaded = {}
+        self._lock = threading.Lock()
+
+    def upload(self, filename, file):
+        time.sleep(self.latency)
+        with self._lock:
+            self.uploaded[filename] = len(file.getvalue())
+
+    def close(self):
+        pass
+
+class FakeCursor:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def executemany(self, query, rows):
+        time.sleep(self.pool.latency)
+        with self.pool.lock:
+            self.pool.rows.extend(rows)
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+
+    def cursor(self):
+        return FakeCursor(self.pool)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+class FakeMySQLPool:
+    def __init__(self, latency):
+        self.latency = latency
+        self.rows = []
+        self.lock = threading.Lock()
+
+    def get_connection(self):
+        return FakeConnection(self)
+
+class FakeCollection:
+    """Implements the handful of pymongo collection calls made by ScrapedUrlStore and ImageIndex."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.documents = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _matches(document, query):
+        for key, condition in query.items():
+            value = document.get(key)
+            if isinstance(condition, dict) and '$in' in condition:
+                values = value if isinstance(value, list) else [value]
+                if not any(item in condition['$in'] for item in values):
+                    return False
+            elif isinstance(value, list):
+                if condition not in value:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    @staticmethod
+    def _project(document, projection):
+        if not projection:
+            return dict(document)
+        return {key: document[key] for key, include in projection.items() if include and key in document}
+
+    def create_index(self, key, unique=False, sparse=False):
+        pass
+
+    def estimated_document_count(self):
+        return len(self.documents)
+
+    def find(self, query, projection=None, batch_size=None):
+        time.sleep(self.latency)
+        with self._lock:
+            return [self._project(document, projection) for document in self.documents if self._matches(document, query)]
+
+    def find_one(self, query, projection=None):
+        return next(iter(self.find(query, projection)), None)
+
+    def _upsert(self, query, update):
+        existing = next((document for document in self.documents if self._matches(document, query)), None)
+        if existing is None:
+            existing = dict(query)
+            existing.update(update.get('$setOnInsert', {}))
+            self.documents.append(existing)
+        for key, value in update.get('$addToSet', {}).items():
+            values = existing.setdefault(key, [])
+            if value not in values:
+                values.append(value)
+
+    def update_one(self, query, update, upsert=False):
+        time.sleep(self.latency)
+        with self._lock:
+            self._upsert(query, update)
+
+    def bulk_write(self, requests, ordered=True):
+        time.sleep(self.latency)
+        with self._lock:
+            for request in requests:
+                # pymongo exposes no public accessors for a queued UpdateOne
+                self._upsert(request._filter, request._doc)
+
+class FakeNotificationSender:
+    def __init__(self, latency):
+        self.latency = latency
+        self.sent = 0
+
+    def build_message(self, title, message, image_url=None):
+        return {'title': title, 'message': message, 'image': image_url}
+
+    def send_batch(self, messages):
+        time.sleep(self.latency)
+        self.sent += len(messages)
+        main.metrics.increment('notifications', len(messages), result='sent')
+        return len(messages)
+
+async def run_pipeline(args, workdir, page, image):
+    main.PIPELINE_CONFIG['queue_path'] = os.path.join(workdir, 'jobs.sqlite3')
+    main.TRANSLATION_CONFIG['cache_path'] = os.path.join(workdir, 'translations.sqlite3')
+    main.http_client = FakeHttpClient(page, image, args.http_latency)
+    main.TRANSLATION_BACKENDS['benchmark'] = lambda config: FakeTranslator(config['source'], config['target'])
+    main.TRANSLATION_CONFIG['backend'] = 'benchmark'
+    if args.translate_rate:
+        main.TRANSLATION_CONFIG['rate'] = main.TRANSLATION_CONFIG['max_rate'] = args.translate_rate
+    main.translation_client = None
+    FakeTranslator.latency = args.translate_latency
+    FakeTranslator.error_rate = args.translate_error_rate
+
+    mysql_pool = FakeMySQLPool(args.mysql_latency)
+    ftp_pool = FakeFtpPool(args.ftp_latency)
+    sender = FakeNotificationSender(args.fcm_latency)
+    news_writer = main.NewsWriter(mysql_pool, main.DB_CONFIG['batch_size'])
+    scraped_urls = FakeCollection(args.mongo_latency)
+    url_store = main.ScrapedUrlStore(
+        lambda: scraped_urls,
+        os.path.join(workdir, 'scraped_urls.bloom'),
+        main.DEDUP_CONFIG['bloom_capacity'],
+        main.DEDUP_CONFIG['bloom_error_rate'],
+        main.DEDUP_CONFIG['flush_size']
+    )
+    image_index = main.ImageIndex(FakeCollection(args.mongo_latency))
+    notification_queue = main.NotificationQueue(sender, 'each', main.NOTIFICATION_CONFIG['batch_size'], 0, args.articles)
+    job_queue = main.JobQueue(
+        main.PIPELINE_CONFIG['queue_path'], main.PIPELINE_CONFIG['max_attempts'],
+        main.PIPELINE_CONFIG['retry_delay'], main.PIPELINE_CONFIG['max_retry_delay']
+    )
+    job_queue.enqueue(url_store.filter_new([ARTICLE_URL.format(number) for number in range(args.articles)]))
+    pipeline = main.ArticlePipeline(
+        job_queue,
+        main.parse_stage_workers(args.workers, main.PIPELINE_CONFIG['workers']),
+        main.PIPELINE_CONFIG['poll_interval'],
+        news_writer,
+        url_store,
+        main.NearDuplicateIndex(lambda: scraped_urls, main.DEDUP_CONFIG['simhash_max_distance']),
+        main.HostRateLimiter(args.host_delay),
+        main.TranslationBatcher(main.TRANSLATION_CONFIG['batch_window']),
+        main.SummaryStore(lambda: FakeCollection(args.mongo_latency)),
+        ftp_pool,
+        image_index,
+        main.NewsRenderer(),
+        notification_queue
+    )
+    start = time.perf_counter()
+    try:
+        titles = await pipeline.run()
+        news_writer.flush()
+        notification_queue.close(main.NOTIFICATION_CONFIG['close_timeout'])
+        elapsed = time.perf_counter() - start
+        summary = job_queue.summary()
+    finally:
+        main.close_translation_cache()
+        main.http_client = None
+        url_store.close()
+        job_queue.close()
+    return {
+        'elapsed': elapsed,
+        'titles': len(titles),
+        'summary': summary,
+        'rows': len(mysql_pool.rows),
+        'uploads': len(ftp_pool.uploaded),
+        'notifications': sender.sent,
+        'translate_calls': FakeTranslator.calls
+    }
+
+def histogram(snapshot, name, **labels):
+    return next((item for item in snapshot['histograms'] if item['name'] == name and item['labels'] == labels), None)
+
+def run(args):
+    logging.disable(logging.CRITICAL)
+    page = load_fixture('gktoday_article.html')
+    image = make_jpeg()
+    if args.trace_memory:
+        tracemalloc.start()
+    with tempfile.TemporaryDirectory() as workdir:
+        result = asyncio.run(run_pipeline(args, workdir, page, image))
+    traced_peak = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+    if args.trace_memory:
+        tracemalloc.stop()
+    snapshot = main.metrics.snapshot()
+
+    article = histogram(snapshot, 'article') or {'p50': 0.0, 'p95': 0.0}
+    print(f"articles        {result['titles']}/{args.articles} completed, queue: {result['summary']}")
+    print(f"side effects    {result['rows']} rows, {result['uploads']} uploads, "
+          f"{result['notifications']} notifications, {result['translate_calls']} translate calls")
+    print(f"wall time       {result['elapsed']:.2f} s")
+    print(f"throughput      {result['titles'] / result['elapsed']:.2f} articles/s")
+    print(f"latency         p50 {article['p50'] * 1000:.0f} ms, p95 {article['p95'] * 1000:.0f} ms")
+    for stage in main.PIPELINE_STAGES:
+        if timing := histogram(snapshot, 'stage', stage=stage):
+            print(f"  {stage:<13} p50 {timing['p50'] * 1000:>7.1f} ms, p95 {timing['p95'] * 1000:>7.1f} ms")
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+    print(f"peak RSS        {peak_rss:.1f} MiB")
+    if traced_peak is not None:
+        print(f"peak traced     {traced_peak / (1024 * 1024):.1f} MiB")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the article pipeline offline against fake services")
+    parser.add_argument('--articles', type=int, default=50, help="number of articles to process")
+    parser.add_argument('--workers', default='', help='per-stage worker overrides, e.g. "translate=8,image=4"')
+    parser.add_argument('--host-delay', type=float, default=0.0, help="seconds between requests to the same host")
+    parser.add_argument('--http-latency', type=float, default=0.05, help="seconds per page or image download")
+    parser.add_argument('--translate-latency', type=float, default=0.3, help="seconds per translate request")
+    parser.add_argument('--translate-rate', type=float, help="translate requests per second (default: TRANSLATION_RATE)")
+    parser.add_argument('--translate-error-rate', type=float, default=0.0, help="fraction of translate requests that fail")
+    parser.add_argument('--ftp-latency', type=float, default=0.05, help="seconds per FTP upload")
+    parser.add_argument('--mysql-latency', type=float, default=0.02, help="seconds per executemany batch")
+    parser.add_argument('--mongo-latency', type=float, default=0.005, help="seconds per MongoDB call")
+    parser.add_argument('--fcm-latency', type=float, default=0.1, help="seconds per send_each batch")
+    parser.add_argument('--trace-memory', action='store_true', help="also measure peak Python allocations with tracemalloc")
+    run(parser.parse_args())
@@ -1,33 +1,49 @@
 import io
 import os
 import requests
-import mysql.connector
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
-from deep_translator import GoogleTranslator
 import asyncio
 import logging
-import tempfile
-from PIL import Image
 import ftplib
 from urllib.parse import urlparse
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
 import hashlib
 import traceback
 import sys
 import random
+import argparse
+import gzip
+import html
+import importlib.util
+import itertools
 import json
-import firebase_admin
-from firebase_admin import credentials, messaging
+import math
+from collections import Counter, deque
+import queue
+import re
+import signal
+import sqlite3
+import threading
+import time
 from dotenv import load_dotenv
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from pymongo import MongoClient  # Added for MongoDB integration
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception, retry_if_exception_type
+
+# firebase_admin, pymongo, mysql.connector, deep_translator and PIL are imported
+# where they are first used, so runs that find no new articles never load them
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging to log only to console
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO),
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[logging.StreamHandler()]
 )
@@ -36,34 +52,340 @@ logging.basicConfig(
 MONGO_URI = os.getenv('MONGO_URI')
 MONGO_DB = os.getenv('MONGO_DB')
 MONGO_COLLECTION = 'scraped_urls'
+MONGO_IMAGE_COLLECTION = 'image_hashes'
+MONGO_SUMMARY_COLLECTION = 'article_summaries'
+
+# Scraped URL deduplication configuration
+DEDUP_CONFIG = {
+    'bloom_path': os.getenv('DEDUP_BLOOM_PATH', '.cache/scraped_urls.bloom'),
+    'bloom_capacity': int(os.getenv('DEDUP_BLOOM_CAPACITY', '200000')),
+    'bloom_error_rate': float(os.getenv('DEDUP_BLOOM_ERROR_RATE', '0.000001')),
+    'flush_size': int(os.getenv('DEDUP_FLUSH_SIZE', '50')),
+    # Articles whose SimHash fingerprints differ in at most this many of 64 bits are duplicates
+    'simhash_max_distance': int(os.getenv('DEDUP_SIMHASH_MAX_DISTANCE', '3')),
+    'simhash_min_words': int(os.getenv('DEDUP_SIMHASH_MIN_WORDS', '40'))
+}
 
 # Database configuration (MySQL)
 DB_CONFIG = {
     'host': os.getenv('DB_HOST'),
     'user': os.getenv('DB_USER'),
     'password': os.getenv('DB_PASSWORD'),
-    'database': os.getenv('DB_NAME')
+    'database': os.getenv('DB_NAME'),
+    'pool_size': int(os.getenv('DB_POOL_SIZE', '2')),
+    'batch_size': int(os.getenv('DB_BATCH_SIZE', '20'))
 }
 
+# Re-render maintenance job over existing tbl_news rows
+RERENDER_CONFIG = {
+    'id_column': os.getenv('NEWS_ID_COLUMN', 'nid'),
+    'batch_size': int(os.getenv('RERENDER_BATCH_SIZE', '200')),
+    # Pause between batches so the job never competes with the app for the table
+    'batch_delay': float(os.getenv('RERENDER_BATCH_DELAY', '1')),
+    'checkpoint_path': os.getenv('RERENDER_CHECKPOINT_PATH', '.cache/rerender_checkpoint.json')
+}
+RERENDER_PARTS = ['html', 'category', 'translation']
+
 # FTP Configuration
 FTP_CONFIG = {
     'host': os.getenv('FTP_HOST'),
     'user': os.getenv('FTP_USER'),
     'password': os.getenv('FTP_PASSWORD'),
     'port': 21,
-    'upload_path': '/'
+    'upload_path': '/',
+    'pool_size': int(os.getenv('FTP_POOL_SIZE', '3')),
+    'timeout': 30,
+    'noop_after': 15
+}
+
+# Image Configuration
+IMAGE_CONFIG = {
+    'format': os.getenv('IMAGE_FORMAT', 'webp').lower(),
+    'quality': int(os.getenv('IMAGE_QUALITY', '80')),
+    'max_width': int(os.getenv('IMAGE_MAX_WIDTH', '1200')),
+    'max_bytes': 15 * 1024 * 1024
+}
+
+# Pillow format name, file extension and save options per output format
+IMAGE_FORMATS = {
+    'webp': ('WEBP', 'webp', {'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'optimize': True, 'progressive': True}),
+    'png': ('PNG', 'png', {'optimize': True})
+}
+
+# Rendering Configuration
+RENDER_CONFIG = {
+    # 'inline' embeds the stylesheet in every article, 'external' links to one published copy
+    'stylesheet': os.getenv('NEWS_STYLESHEET_MODE', 'inline'),
+    'asset_base_url': os.getenv('NEWS_ASSET_BASE_URL', 'https://newsadmin.currentadda.com/upload/')
+}
+
+# Notification Configuration
+NOTIFICATION_CONFIG = {
+    # 'each' sends one push per article, 'digest' one aggregated push per run
+    'mode': os.getenv('NOTIFICATION_MODE', 'each'),
+    'batch_size': int(os.getenv('NOTIFICATION_BATCH_SIZE', '10')),
+    'min_interval': float(os.getenv('NOTIFICATION_MIN_INTERVAL', '5')),
+    'max_per_run': int(os.getenv('NOTIFICATION_MAX_PER_RUN', '20')),
+    'close_timeout': float(os.getenv('NOTIFICATION_CLOSE_TIMEOUT', '30'))
 }
 
 # Telegram Configuration
-TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
-TELEGRAM_CHANNEL = os.getenv('TELEGRAM_CHANNEL')
+TELEGRAM_CONFIG = {
+    'bot_token': os.getenv('TELEGRAM_BOT_TOKEN'),
+    'channel': os.getenv('TELEGRAM_CHANNEL'),
+    'timeout': 15,
+    'max_attempts': int(os.getenv('TELEGRAM_MAX_ATTEMPTS', '5')),
+    'close_timeout': float(os.getenv('TELEGRAM_CLOSE_TIMEOUT', '30'))
+}
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# Scraper Configuration
+SCRAPER_CONFIG = {
+    'concurrency': int(os.getenv('SCRAPER_CONCURRENCY', '4')),
+    'host_delay': float(os.getenv('SCRAPER_HOST_DELAY', '2')),
+    'pages': int(os.getenv('SCRAPER_PAGES', '3')),
+    'listing_concurrency': int(os.getenv('SCRAPER_LISTING_CONCURRENCY', '4')),
+    # Listing pages have their own, shorter spacing; requests still overlap up to listing_concurrency
+    'listing_delay': float(os.getenv('SCRAPER_LISTING_DELAY', '0.25')),
+    'sources': [name.strip() for name in os.getenv('NEWS_SOURCES', 'gktoday').split(',') if name.strip()]
+}
+
+
+def parse_stage_workers(spec, defaults):
+    """Parses a "stage=count,..." override such as "translate=8,image=4" on top of the defaults."""
+    workers = dict(defaults)
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        stage, _, count = item.partition('=')
+        workers[stage.strip()] = int(count)
+    return workers
+
+# Pipeline Configuration
+PIPELINE_CONFIG = {
+    'queue_path': os.getenv('PIPELINE_QUEUE_PATH', '.cache/jobs.sqlite3'),
+    'max_attempts': int(os.getenv('PIPELINE_MAX_ATTEMPTS', '3')),
+    # Seconds before a failed job is retried; the delay grows fourfold with each attempt up to the maximum
+    'retry_delay': float(os.getenv('PIPELINE_RETRY_DELAY', '600')),
+    'max_retry_delay': float(os.getenv('PIPELINE_MAX_RETRY_DELAY', '21600')),
+    'poll_interval': 0.2,
+    'workers': parse_stage_workers(os.getenv('PIPELINE_WORKERS', ''), {
+        'fetch': SCRAPER_CONFIG['concurrency'],
+        'parse': 2,
+        'translate': 4,
+        'precompute': 2,
+        'image': int(os.getenv('FTP_POOL_SIZE', '3')),
+        'persist': 2,
+        'notify': 1
+    })
+}
+
+# HTTP Configuration
+HTTP_CONFIG = {
+    'cache_dir': os.getenv('HTTP_CACHE_DIR', '.cache/http'),
+    'cache_max_age_days': float(os.getenv('HTTP_CACHE_MAX_AGE_DAYS', '365')),
+    'pool_size': int(os.getenv('HTTP_POOL_SIZE', '10')),
+    'timeout': 30
+}
+
+# HTML parsing: BeautifulSoup tree builder for article pages and backend for listing pages
+HTML_PARSER = os.getenv('HTML_PARSER') or ('lxml' if importlib.util.find_spec('lxml') else 'html.parser')
+LISTING_PARSER = os.getenv('LISTING_PARSER') or ('selectolax' if LexborHTMLParser else 'bs4')
+
+# Translation Configuration
+TRANSLATION_CONFIG = {
+    'batch_chars': int(os.getenv('TRANSLATION_BATCH_CHARS', '4500')),
+    'batch_window': float(os.getenv('TRANSLATION_BATCH_WINDOW', '0.5')),
+    'source': 'auto',
+    'target': 'gu',
+    'cache_path': os.getenv('TRANSLATION_CACHE_PATH', '.cache/translations.sqlite3'),
+    'cache_max_entries': int(os.getenv('TRANSLATION_CACHE_MAX_ENTRIES', '200000')),
+    'cache_ttl_days': float(os.getenv('TRANSLATION_CACHE_TTL_DAYS', '180')),
+    # One of TRANSLATION_BACKENDS; keyed providers read TRANSLATION_API_KEY and friends
+    'backend': os.getenv('TRANSLATION_BACKEND', 'google').lower(),
+    'api_key': os.getenv('TRANSLATION_API_KEY'),
+    'region': os.getenv('TRANSLATION_REGION'),
+    'base_url': os.getenv('TRANSLATION_BASE_URL'),
+    # Requests per second: the token bucket starts at `rate` and adapts between min_rate and max_rate
+    'rate': float(os.getenv('TRANSLATION_RATE', '3')),
+    'min_rate': float(os.getenv('TRANSLATION_MIN_RATE', '0.2')),
+    'max_rate': float(os.getenv('TRANSLATION_MAX_RATE', '10')),
+    'burst': int(os.getenv('TRANSLATION_BURST', '3')),
+    'latency_target': float(os.getenv('TRANSLATION_LATENCY_TARGET', '5')),
+    # Consecutive failures that open the circuit, and how long it stays open (doubling up to max_cooldown)
+    'failure_threshold': int(os.getenv('TRANSLATION_FAILURE_THRESHOLD', '5')),
+    'cooldown': float(os.getenv('TRANSLATION_COOLDOWN', '30')),
+    'max_cooldown': float(os.getenv('TRANSLATION_MAX_COOLDOWN', '600')),
+    # How long the translate stage waits for the backend before deferring articles to the next run
+    'max_pause': float(os.getenv('TRANSLATION_MAX_PAUSE', '300'))
+}
+TRANSLATION_DELIMITER = '\n'
+
+# Precomputed article fields stored next to each news row
+SUMMARY_CONFIG = {
+    'snippet_chars': int(os.getenv('SUMMARY_SNIPPET_CHARS', '200')),
+    'max_key_facts': int(os.getenv('SUMMARY_MAX_KEY_FACTS', '8'))
+}
+
+# Daemon mode: poll interval bounds in seconds and the health/metrics endpoint (port 0 disables it)
+DAEMON_CONFIG = {
+    'min_interval': float(os.getenv('DAEMON_MIN_INTERVAL', '120')),
+    'max_interval': float(os.getenv('DAEMON_MAX_INTERVAL', '1800')),
+    'backoff': float(os.getenv('DAEMON_BACKOFF', '1.5')),
+    'health_host': os.getenv('HEALTH_HOST', '0.0.0.0'),
+    'health_port': int(os.getenv('HEALTH_PORT', '8080'))
+}
+# The health check fails when no cycle has succeeded for this long
+DAEMON_CONFIG['stale_after'] = float(os.getenv('DAEMON_STALE_AFTER', str(DAEMON_CONFIG['max_interval'] * 3)))
+
+# Metrics Configuration
+METRICS_CONFIG = {
+    'report_path': os.getenv('METRICS_REPORT_PATH', 'run_report.json'),
+    # Optional node_exporter textfile collector output
+    'prometheus_path': os.getenv('METRICS_PROMETHEUS_PATH')
+}
+
+class Metrics:
+    """Thread-safe run metrics: latency histograms, counters and gauges, each with optional labels."""
+
+    buckets = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float('inf'))
+    max_samples = 10000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._gauges = {}
+        self.started_at = time.time()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def observe(self, name, seconds, **labels):
+        with self._lock:
+            histogram = self._histograms.setdefault(self._key(name, labels), {
+                'bucket_counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0,
+                # Percentiles cover the most recent samples, which keeps a long-running process bounded
+                'samples': deque(maxlen=self.max_samples)
+            })
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram['bucket_counts'][index] += 1
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+            histogram['samples'].append(seconds)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def increment(self, name, value=1, **labels):
+        with self._lock:
+            key = self._key(name, labels)
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self._gauges[self._key(name, labels)] = value
+
+    @staticmethod
+    def _percentile(samples, fraction):
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+    def snapshot(self):
+        with self._lock:
+            histograms = [
+                {'name': name, 'labels': dict(labels), 'count': histogram['count'],
+                 'sum': round(histogram['sum'], 4),
+                 'p50': round(self._percentile(histogram['samples'], 0.5), 4),
+                 'p95': round(self._percentile(histogram['samples'], 0.95), 4),
+                 'max': round(max(histogram['samples'], default=0.0), 4)}
+                for (name, labels), histogram in sorted(self._histograms.items())
+            ]
+            counters = [{'name': name, 'labels': dict(labels), 'value': value} for (name, labels), value in sorted(self._counters.items())]
+            gauges = [{'name': name, 'labels': dict(labels), 'value': value} for (name, labels), value in sorted(self._gauges.items())]
+        return {
+            'started_at': datetime.utcfromtimestamp(self.started_at).isoformat() + 'Z',
+            'duration_seconds': round(time.time() - self.started_at, 3),
+            'histograms': histograms,
+            'counters': counters,
+            'gauges': gauges
+        }
+
+    def write_json(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.snapshot(), file, indent=2)
+
+    def prometheus_text(self):
+        def format_labels(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            return "{" + ",".join(f'{key}="{value}"' for key, value in pairs) + "}" if pairs else ""
+
+        lines = []
+        declared = set()
+
+        def declare(metric, kind):
+            # The exposition format allows a single TYPE line per metric family
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f"# TYPE {metric} {kind}")
+
+        with self._lock:
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                metric = f"news_scraper_{name}_seconds"
+                declare(metric, 'histogram')
+                for bound, count in zip(self.buckets, histogram['bucket_counts']):
+                    le = "+Inf" if bound == float('inf') else bound
+                    lines.append(f"{metric}_bucket{format_labels(labels, [('le', le)])} {count}")
+                lines.append(f"{metric}_sum{format_labels(labels)} {histogram['sum']}")
+                lines.append(f"{metric}_count{format_labels(labels)} {histogram['count']}")
+            for (name, labels), value in sorted(self._counters.items()):
+                declare(f"news_scraper_{name}_total", 'counter')
+                lines.append(f"news_scraper_{name}_total{format_labels(labels)} {value}")
+            for (name, labels), value in sorted(self._gauges.items()):
+                declare(f"news_scraper_{name}", 'gauge')
+                lines.append(f"news_scraper_{name}{format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        # Written atomically so the textfile collector never reads a partial file
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as file:
+            file.write(self.prometheus_text())
+        os.replace(temp_path, path)
+
+metrics = Metrics()
+
+def count_retry(operation):
+    """tenacity before_sleep hook that counts retries of `operation`."""
+    def before_sleep(retry_state):
+        metrics.increment('retries', operation=operation)
+        logging.warning(f"Retrying {operation} (attempt {retry_state.attempt_number}): {retry_state.outcome.exception()}")
+    return before_sleep
+
+def write_metrics_report():
+    try:
+        if METRICS_CONFIG['report_path']:
+            metrics.write_json(METRICS_CONFIG['report_path'])
+            logging.info(f"Run metrics written to {METRICS_CONFIG['report_path']}")
+        if METRICS_CONFIG['prometheus_path']:
+            metrics.write_prometheus(METRICS_CONFIG['prometheus_path'])
+    except OSError as e:
+        logging.error(f"Error writing run metrics: {e}")
 
 # Initialize Firebase
 def initialize_firebase():
+    import firebase_admin
+    from firebase_admin import credentials
     if not firebase_admin._apps:
         service_account_json = os.getenv('FIREBASE_SERVICE_ACCOUNT')
         service_account_path = os.getenv('FIREBASE_SERVICE_ACCOUNT_PATH')
-        logging.debug(f"Firebase service account path: {service_account_path}")
+        logging.debug("Firebase service account path: %s", service_account_path)
         if service_account_json:
             cred = credentials.Certificate(json.loads(service_account_json))
         elif service_account_path and os.path.exists(service_account_path):
@@ -75,546 +397,3026 @@ def initialize_firebase():
     else:
         logging.debug("Firebase already initialized, skipping reinitialization")
 
-initialize_firebase()
-
-CATEGORY_MAP = {
-    "વિજ્ઞાન અને ટેકનોલોજી વર્તમાન બાબતો": 12,
-    "સંરક્ષણ વર્તમાન બાબતો": 13,
-    "કાનૂની અને બંધારણ વર્તમાન બાબતો": 14,
-    "પર્યાવરણ વર્તમાન બાબતો": 15,
-    "સરકારી યોજનાઓ વર્તમાન બાબતો": 16,
-    "અર્થતંત્ર અને બેંકિંગ વર્તમાન બાબતો": 17,
-    "આંતરરાષ્ટ્રીય / વિશ્વ વર્તમાન બાબતો": 18,
-    "સમિટ અને પરિષદો": 19,
-    "મહત્વપૂર્ણ દિવસો અને ઘટનાઓ વર્તમાન બાબતો": 20,
-    "અહેવાલો અને સૂચકાંકો વર્તમાન બાબતો": 21,
-    "રમતગમત વર્તમાન બાબતો": 22,
-    "સમાચારમાં પુરસ્કારો, સન્માનો અને વ્યક્તિઓ": 23,
-    "કૃષિ વર્તમાન બાબતો": 24,
-    "કલા અને સંસ્કૃતિ વર્તમાન બાબતો": 25,
-    "વિજ્ and ાન અને તકનીકી વર્તમાન બાબતો":12,
-    "આરોગ્ય વર્તમાન બાબતો":26,
-    "એવોર્ડ્સ, સન્માન અને વ્યક્તિઓ":27
+DEFAULT_CATEGORY_ID = 1
+
+# Gujarati category names (with known translation variants), the English gktoday
+# category names and body keywords used to score each category
+CATEGORIES = {
+    12: {
+        'gu': ["વિજ્ઞાન અને ટેકનોલોજી વર્તમાન બાબતો", "વિજ્ and ાન અને તકનીકી વર્તમાન બાબતો"],
+        'en': ["Science & Technology Current Affairs", "Science and Technology"],
+        'keywords': ["isro", "satellite", "spacecraft", "artificial intelligence", "quantum", "semiconductor", "drdo lab"]
+    },
+    13: {
+        'gu': ["સંરક્ષણ વર્તમાન બાબતો"],
+        'en': ["Defence Current Affairs", "Defense Current Affairs"],
+        'keywords': ["indian army", "indian navy", "indian air force", "military exercise", "missile", "warship", "drdo"]
+    },
+    14: {
+        'gu': ["કાનૂની અને બંધારણ વર્તમાન બાબતો"],
+        'en': ["Legal & Constitution Current Affairs", "Polity Current Affairs"],
+        'keywords': ["supreme court", "high court", "constitution", "amendment", "article 370", "judgment", "bill passed"]
+    },
+    15: {
+        'gu': ["પર્યાવરણ વર્તમાન બાબતો"],
+        'en': ["Environment Current Affairs", "Ecology Current Affairs"],
+        'keywords': ["climate change", "biodiversity", "wildlife", "tiger reserve", "wetland", "emissions", "ramsar"]
+    },
+    16: {
+        'gu': ["સરકારી યોજનાઓ વર્તમાન બાબતો"],
+        'en': ["Government Schemes Current Affairs"],
+        'keywords': ["scheme", "yojana", "mission launched", "beneficiaries", "ministry launched"]
+    },
+    17: {
+        'gu': ["અર્થતંત્ર અને બેંકિંગ વર્તમાન બાબતો"],
+        'en': ["Economy & Banking Current Affairs", "Economy Current Affairs", "Banking Current Affairs"],
+        'keywords': ["reserve bank", "rbi", "repo rate", "inflation", "gdp", "fiscal deficit", "sebi"]
+    },
+    18: {
+        'gu': ["આંતરરાષ્ટ્રીય / વિશ્વ વર્તમાન બાબતો"],
+        'en': ["International / World Current Affairs", "International Current Affairs", "World Current Affairs"],
+        'keywords': ["united nations", "bilateral", "prime minister of", "foreign minister", "embassy"]
+    },
+    19: {
+        'gu': ["સમિટ અને પરિષદો"],
+        'en': ["Summits & Conferences", "Summits and Conferences Current Affairs"],
+        'keywords': ["summit", "conference", "g20", "brics", "shanghai cooperation organisation", "conference of parties"]
+    },
+    20: {
+        'gu': ["મહત્વપૂર્ણ દિવસો અને ઘટનાઓ વર્તમાન બાબતો"],
+        'en': ["Important Days & Events Current Affairs", "Important Days Current Affairs"],
+        'keywords': ["observed every year", "is celebrated on", "international day", "world day", "national day", "theme for"]
+    },
+    21: {
+        'gu': ["અહેવાલો અને સૂચકાંકો વર્તમાન બાબતો"],
+        'en': ["Reports & Indices Current Affairs", "Reports and Indices"],
+        'keywords': ["index", "ranked", "ranking", "report released", "survey"]
+    },
+    22: {
+        'gu': ["રમતગમત વર્તમાન બાબતો"],
+        'en': ["Sports Current Affairs"],
+        'keywords': ["tournament", "championship", "olympic", "medal", "cricket", "world cup", "grand slam"]
+    },
+    23: {
+        'gu': ["સમાચારમાં પુરસ્કારો, સન્માનો અને વ્યક્તિઓ"],
+        'en': ["Awards, Honours & Persons in News", "Persons in News Current Affairs"],
+        'keywords': ["award", "awarded", "honoured", "conferred", "appointed as", "passed away"]
+    },
+    24: {
+        'gu': ["કૃષિ વર્તમાન બાબતો"],
+        'en': ["Agriculture Current Affairs"],
+        'keywords': ["farmers", "crop", "kharif", "rabi", "msp", "fertiliser", "agricultural"]
+    },
+    25: {
+        'gu': ["કલા અને સંસ્કૃતિ વર્તમાન બાબતો"],
+        'en': ["Art & Culture Current Affairs", "Art and Culture"],
+        'keywords': ["festival", "heritage", "unesco", "dance form", "temple", "gi tag"]
+    },
+    26: {
+        'gu': ["આરોગ્ય વર્તમાન બાબતો"],
+        'en': ["Health Current Affairs"],
+        'keywords': ["vaccine", "disease", "world health organization", "health ministry", "virus", "hospital"]
+    },
+    27: {
+        'gu': ["એવોર્ડ્સ, સન્માન અને વ્યક્તિઓ"],
+        'en': [],
+        'keywords': []
+    }
 }
 
 # MongoDB connection
 def create_mongo_connection():
+    from pymongo import MongoClient
     try:
         client = MongoClient(MONGO_URI)
-        db = client[MONGO_DB]
-        collection = db[MONGO_COLLECTION]
         logging.info("MongoDB connection successful")
-        return client, collection
+        return client
     except Exception as e:
         logging.error(f"MongoDB connection error: {e}")
-        return None, None
+        return None
 
-def log_scraped_url(collection, url):
-    try:
-        document = {
-            'url': url,
-            'scraped_at': datetime.utcnow()
-        }
-        collection.insert_one(document)
-        logging.debug(f"Logged URL to MongoDB: {url}")
-    except Exception as e:
-        logging.error(f"Error logging URL to MongoDB: {e}")
+mongo_client = None
 
-def is_url_scraped(collection, url):
-    try:
-        result = collection.find_one({'url': url})
-        return result is not None
-    except Exception as e:
-        logging.error(f"Error checking URL in MongoDB: {e}")
-        return False
+def get_mongo_collection(name):
+    global mongo_client
+    if mongo_client is None:
+        mongo_client = create_mongo_connection()
+        if not mongo_client:
+            raise Exception("Failed to establish MongoDB connection")
+    return mongo_client[MONGO_DB][name]
+
+def close_mongo_client():
+    global mongo_client
+    if mongo_client is not None:
+        mongo_client.close()
+        mongo_client = None
+        logging.info("MongoDB connection closed")
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a SHA-256 digest."""
+
+    def __init__(self, capacity, error_rate, bits=None, count=0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = count
+
+    def _positions(self, item):
+        digest = hashlib.sha256(item.encode()).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:16], 'big') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def save(self, path):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        header = json.dumps({'capacity': self.capacity, 'error_rate': self.error_rate, 'count': self.count})
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(header.encode() + b'\n')
+            file.write(self.bits)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            header = json.loads(file.readline())
+            bits = bytearray(file.read())
+        bloom = cls(header['capacity'], header['error_rate'], bits, header['count'])
+        if len(bits) != (bloom.size + 7) // 8:
+            raise ValueError(f"Corrupt Bloom filter snapshot: {path}")
+        return bloom
+
+class ScrapedUrlStore:
+    """Deduplicates article URLs against MongoDB with one query per candidate list.
+
+    A local Bloom filter snapshot of known URLs answers most lookups without a
+    network round trip; only URLs it has never seen are checked in MongoDB.
+    The collection is opened through `get_collection` on first use, so a run
+    whose URLs are all in the snapshot never connects to MongoDB.
+    """
+
+    def __init__(self, get_collection, bloom_path, bloom_capacity, bloom_error_rate, flush_size):
+        self.get_collection = get_collection
+        self.bloom_path = bloom_path
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.flush_size = flush_size
+        self._collection = None
+        self._pending = []
+        self._lock = threading.Lock()
+        self._bloom_changed = False
+        self.bloom = self._load_bloom()
+
+    @property
+    def collection(self):
+        with self._lock:
+            if self._collection is None:
+                self._collection = self.get_collection()
+                self._ensure_index()
+            return self._collection
+
+    def _ensure_index(self):
+        from pymongo.errors import OperationFailure
+        try:
+            self._collection.create_index('url', unique=True)
+        except OperationFailure as e:
+            # Older runs could log the same URL twice; keep lookups indexed until they are cleaned up
+            logging.warning(f"Could not create unique index on scraped URLs, using a plain index: {e}")
+            self._collection.create_index('url')
+        self._collection.create_index('news_title', sparse=True)
+
+    def _load_bloom(self):
+        try:
+            bloom = BloomFilter.load(self.bloom_path)
+            if bloom.count <= bloom.capacity:
+                logging.info(f"Loaded scraped URL snapshot with {bloom.count} URLs")
+                return bloom
+            logging.info("Scraped URL snapshot is over capacity, rebuilding")
+        except FileNotFoundError:
+            logging.info("No scraped URL snapshot found, building one from MongoDB")
+        except (ValueError, KeyError) as e:
+            logging.warning(f"Ignoring unreadable scraped URL snapshot: {e}")
+        return self._rebuild_bloom()
+
+    def _rebuild_bloom(self):
+        total = self.collection.estimated_document_count()
+        capacity = max(self.bloom_capacity, total * 2)
+        bloom = BloomFilter(capacity, self.bloom_error_rate)
+        for document in self.collection.find({}, {'url': 1, '_id': 0}, batch_size=5000):
+            if document.get('url'):
+                bloom.add(document['url'])
+        logging.info(f"Built scraped URL snapshot with {bloom.count} URLs")
+        self._bloom_changed = True
+        return bloom
+
+    def filter_new(self, urls):
+        """Returns the URLs that have not been scraped yet, in their original order and without duplicates."""
+        unique_urls = list(dict.fromkeys(urls))
+        candidates = [url for url in unique_urls if url not in self.bloom]
+        if not candidates:
+            return []
+        with metrics.timer('mongo', operation='filter_new'):
+            known = {document['url'] for document in self.collection.find({'url': {'$in': candidates}}, {'url': 1, '_id': 0})}
+        metrics.increment('dedup_urls', len(unique_urls) - len(candidates), source='bloom')
+        metrics.increment('dedup_urls', len(known), source='mongo')
+        with self._lock:
+            for url in known:
+                self.bloom.add(url)
+            self._bloom_changed = self._bloom_changed or bool(known)
+        logging.info(f"{len(unique_urls) - len(candidates)} URLs known locally, {len(known)} found in MongoDB")
+        return [url for url in candidates if url not in known]
+
+    def record(self, url, fields=None):
+        with self._lock:
+            self._pending.append(dict(fields or {}, url=url, scraped_at=datetime.utcnow()))
+            should_flush = len(self._pending) >= self.flush_size
+        if should_flush:
+            try:
+                self.flush()
+            except Exception as e:
+                # The batch stays pending and goes out with the next flush
+                logging.error(f"Error logging URLs to MongoDB: {e}")
+
+    def flush(self):
+        """Writes pending URLs to MongoDB; on failure they are kept pending and the error is raised."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        from pymongo import UpdateOne
+        try:
+            with metrics.timer('mongo', operation='record'):
+                self.collection.bulk_write(
+                    [UpdateOne({'url': document['url']}, {'$setOnInsert': document}, upsert=True) for document in pending],
+                    ordered=False
+                )
+        except Exception:
+            with self._lock:
+                self._pending = pending + self._pending
+            raise
+        with self._lock:
+            for document in pending:
+                self.bloom.add(document['url'])
+            self._bloom_changed = True
+        logging.debug("Logged %d URLs to MongoDB", len(pending))
+
+    def checkpoint(self):
+        """Writes pending URLs to MongoDB and saves the Bloom filter snapshot if it changed.
+
+        Raises if the URLs could not be written; the snapshot is saved either way.
+        """
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                if self._bloom_changed:
+                    self.bloom.save(self.bloom_path)
+                    self._bloom_changed = False
+
+    def close(self):
+        try:
+            self.checkpoint()
+        except Exception as e:
+            with self._lock:
+                lost = len(self._pending)
+            logging.error(f"Error logging {lost} URLs to MongoDB on close: {e}")
+
+def simhash(text, shingle_size=3):
+    """64-bit SimHash of the word shingles of `text`; similar texts get fingerprints a few bits apart."""
+    words = re.findall(r'[a-z0-9]+', text.lower())
+    shingles = Counter(" ".join(words[i:i + shingle_size]) for i in range(max(1, len(words) - shingle_size + 1)))
+    weights = [0] * 64
+    for shingle, count in shingles.items():
+        value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+def article_fingerprint(article, min_words):
+    """SimHash of an article's English body text, or None when it is too short to compare reliably."""
+    text = " ".join(block['text'] for block in article['blocks'])
+    if len(text.split()) < min_words:
+        return None
+    return simhash(text)
 
-def create_db_connection():
+class NearDuplicateIndex:
+    """Finds articles whose body is a near-duplicate of one already scraped, by SimHash distance.
+
+    Fingerprints are stored with the scraped URL records together with their
+    band keys: the 64 bits are split into max_distance + 1 bands, and two
+    fingerprints within max_distance bits must agree on at least one band. A
+    single indexed $in query on the band keys returns the candidates, which
+    are then checked by Hamming distance. Articles claimed earlier in the
+    same run are checked in memory, since they are recorded only on commit;
+    the claim is released if the article fails for good.
+    """
+
+    def __init__(self, get_collection, max_distance):
+        self.get_collection = get_collection
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        edges = [round(64 * index / bands) for index in range(bands + 1)]
+        self.bands = list(zip(edges, edges[1:]))
+        self._collection = None
+        self._claimed = {}
+        self._lock = threading.Lock()
+
+    @property
+    def collection(self):
+        with self._lock:
+            if self._collection is None:
+                self._collection = self.get_collection()
+                self._collection.create_index('simhash_bands', sparse=True)
+            return self._collection
+
+    def band_keys(self, fingerprint):
+        return [f"{index}:{fingerprint >> start & ((1 << end - start) - 1):x}" for index, (start, end) in enumerate(self.bands)]
+
+    def fields(self, fingerprint):
+        """Fields to store with the scraped URL record of an article with this fingerprint."""
+        if fingerprint is None:
+            return {}
+        return {'simhash': f"{fingerprint:016x}", 'simhash_bands': self.band_keys(fingerprint)}
+
+    def _is_near(self, fingerprint, other):
+        return bin(fingerprint ^ other).count('1') <= self.max_distance
+
+    def check_and_claim(self, url, fingerprint):
+        """Returns the URL this article duplicates, or claims the fingerprint for `url` and returns None."""
+        keys = self.band_keys(fingerprint)
+        with metrics.timer('mongo', operation='near_duplicate'):
+            candidates = list(self.collection.find({'simhash_bands': {'$in': keys}}, {'url': 1, 'simhash': 1, '_id': 0}))
+        for candidate in candidates:
+            if candidate.get('url') != url and self._is_near(fingerprint, int(candidate['simhash'], 16)):
+                return candidate['url']
+        with self._lock:
+            for key in keys:
+                for other_url, other in self._claimed.get(key, ()):
+                    if other_url != url and self._is_near(fingerprint, other):
+                        return other_url
+            for key in keys:
+                self._claimed.setdefault(key, []).append((url, fingerprint))
+        return None
+
+    def release(self, url):
+        """Drops the claim of an article that will never be stored, so a copy of it can take its place."""
+        with self._lock:
+            for key, claims in self._claimed.items():
+                self._claimed[key] = [claim for claim in claims if claim[0] != url]
+
+def is_mysql_error(exception):
+    import mysql.connector
+    return isinstance(exception, mysql.connector.Error)
+
+def create_db_pool():
+    import mysql.connector
+    from mysql.connector import pooling
     try:
-        logging.info("Attempting to create database connection...")
-        connection = mysql.connector.connect(
+        logging.info("Attempting to create database connection pool...")
+        # The C extension is much faster than the pure-Python protocol when it is installed
+        pool = pooling.MySQLConnectionPool(
+            pool_name='news_writer',
+            pool_size=DB_CONFIG['pool_size'],
             host=DB_CONFIG['host'],
             user=DB_CONFIG['user'],
             password=DB_CONFIG['password'],
             database=DB_CONFIG['database'],
             port=3306,
-            use_pure=True,
+            use_pure=not mysql.connector.HAVE_CEXT,
             connection_timeout=10
         )
-        connection.ping(reconnect=True)
-        logging.info("Database connection successful")
-        return connection
+        logging.info(f"Database connection pool created (C extension: {mysql.connector.HAVE_CEXT})")
+        return pool
     except mysql.connector.Error as err:
         logging.error(f"Database connection error: {err}")
         return None
 
-def check_and_reconnect(connection):
-    try:
-        if connection and connection.is_connected():
-            connection.ping(reconnect=True)
-            logging.debug("Database connection is alive")
-            return connection
-        logging.info("Connection lost, reconnecting...")
-        return create_db_connection()
-    except mysql.connector.Error as err:
-        logging.error(f"Error during connection check: {err}")
-        return create_db_connection()
+class CachedResponse:
+    def __init__(self, url, content, content_type, not_modified=False, from_cache=False):
+        self.url = url
+        self.content = content
+        self.content_type = content_type
+        self.not_modified = not_modified
+        self.from_cache = from_cache
 
-def fetch_article_urls(base_url, pages):
-    article_urls = []
-    session = requests.Session()
-    logging.info(f"Fetching article URLs from {base_url} for {pages} pages")
-    for page in range(1, pages + 3):
-        url = base_url if page == 1 else f"{base_url}page/{page}/"
-        try:
-            response = session.get(url, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            page_articles = [a_tag['href'] for h1_tag in soup.find_all('h1', id='list')
-                           if (a_tag := h1_tag.find('a')) and a_tag.get('href')]
-            article_urls.extend(page_articles)
-            logging.info(f"Found {len(page_articles)} articles on page {page}")
-        except requests.RequestException as e:
-            logging.error(f"Error fetching page {page}: {e}")
-            continue
-    return article_urls
+    @property
+    def text(self):
+        # requests assumes ISO-8859-1 when the server omits the charset; gktoday pages are UTF-8
+        match = re.search(r'charset=([\w-]+)', self.content_type or '', re.I)
+        return self.content.decode(match.group(1) if match else 'utf-8', errors='replace')
 
-translation_cache = {}
+class HttpClient:
+    """One pooled keep-alive session for every HTTP call, with an on-disk page cache keyed by URL.
 
-def translate_to_gujarati(text):
-    if not text or len(text.strip()) == 0:
-        logging.debug("Empty text received for translation, returning as-is")
-        return text
-    if text in translation_cache:
-        logging.debug(f"Using cached translation for: {text[:50]}...")
-        return translation_cache[text]
-    try:
-        logging.debug(f"Translating: {text[:50]}...")
-        translator = GoogleTranslator(source='auto', target='gu')
-        translated = translator.translate(text)
-        translation_cache[text] = translated
-        logging.debug(f"Translated to: {translated[:50]}...")
-        return translated
-    except Exception as e:
-        logging.warning(f"Translation error: {e}, returning original text")
-        return text
+    Cached pages are revalidated with ETag/Last-Modified so unchanged pages come
+    back as 304s, or served without any request when the caller prefers the cache.
+    Bodies are stored gzip-compressed.
+    """
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type((requests.RequestException, ftplib.all_errors)))
-def download_and_process_image(image_url):
-    temp_file_path = None
-    ftp = None
-    try:
-        logging.info(f"Downloading image from: {image_url}")
-        response = requests.get(image_url, timeout=30)
+    def __init__(self, cache_dir, pool_size, timeout):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # urllib3 only decodes brotli when one of the brotli packages is installed
+        brotli = importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi')
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate, br' if brotli else 'gzip, deflate'
+
+    def _cache_paths(self, url):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        directory = os.path.join(self.cache_dir, key[:2])
+        return directory, os.path.join(directory, f"{key}.json"), os.path.join(directory, f"{key}.html.gz")
+
+    def has_cached(self, url):
+        return os.path.exists(self._cache_paths(url)[2])
+
+    def cached(self, url):
+        _, meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(meta_path) as file:
+                meta = json.load(file)
+            with gzip.open(body_path, 'rb') as file:
+                return meta, file.read()
+        except (OSError, ValueError):
+            return None, None
+
+    def _store(self, url, response):
+        directory, meta_path, body_path = self._cache_paths(url)
+        os.makedirs(directory, exist_ok=True)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+            'fetched_at': time.time()
+        }
+        for path, write in ((body_path, lambda f: f.write(gzip.compress(response.content))),
+                            (meta_path, lambda f: f.write(json.dumps(meta).encode()))):
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as file:
+                write(file)
+            os.replace(temp_path, path)
+
+    def get_page(self, url, prefer_cache=False):
+        """Fetches an HTML page, revalidating or (with prefer_cache) reusing the cached copy."""
+        meta, body = self.cached(url)
+        if body is not None and prefer_cache:
+            logging.debug("Using cached page: %s", url)
+            metrics.increment('http_requests', result='cached')
+            return CachedResponse(url, body, meta['content_type'], from_cache=True)
+        headers = {}
+        if body is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        with metrics.timer('http_request'):
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and body is not None:
+            logging.debug("Page not modified: %s", url)
+            metrics.increment('http_requests', result='not_modified')
+            return CachedResponse(url, body, meta['content_type'], not_modified=True, from_cache=True)
         response.raise_for_status()
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            temp_file_path = tmp_file.name
-            logging.debug(f"Created temp file: {temp_file_path}")
-            img = Image.open(io.BytesIO(response.content)).convert('RGB')
-            img.save(temp_file_path, 'PNG')
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            hash_object = hashlib.md5(image_url.encode())
-            filename = f"news_{timestamp}_{hash_object.hexdigest()[:8]}.png"
-            ftp = ftplib.FTP()
-            ftp.connect(FTP_CONFIG['host'], FTP_CONFIG['port'])
-            ftp.login(FTP_CONFIG['user'], FTP_CONFIG['password'])
-            ftp.cwd(FTP_CONFIG['upload_path'])
-            with open(temp_file_path, 'rb') as file:
-                ftp.storbinary(f'STOR {filename}', file)
-            logging.info(f"Image uploaded as: {filename}")
-            return filename
-    except Exception as e:
-        logging.error(f"Image processing error: {e}")
-        raise
-    finally:
-        if ftp and ftp.sock:
-            ftp.quit()
-            logging.debug("FTP connection closed")
-        if temp_file_path and os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
-            logging.debug(f"Temporary file deleted: {temp_file_path}")
-
-def format_content_as_html(content_list):
-    try:
-        translated_content = next((item['text'] for item in content_list if item.get('type') in ['heading', 'paragraph'] and item.get('text')), "Article")
-        translated_first_paragraph = next((item['text'] for item in content_list if item.get('type') == 'paragraph' and item.get('text')), "")
-        logging.debug(f"Formatting HTML with title: {translated_content[:50]}...")
-
-        # CSS styles
-        css = '''
-            <style>
-            :root {
-                --primary-color: #2c3e50;
-                --secondary-color: #e74c3c;
-                --accent-color: #f1c40f;
-                --background-light: #ecf0f1;
-                --text-dark: #34495e;
-                --shadow: 0 8px 16px rgba(0, 0, 0, 0.2);
-            }
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            body {
-                font-family: 'Hind Vadodara', sans-serif;
-                background: linear-gradient(135deg, #bdc3c7, #2c3e50);
-                color: var(--text-dark);
-                line-height: 1.8;
-                overflow-x: hidden;
-            }
-            .header {
-                background: linear-gradient(90deg, var(--primary-color), var(--secondary-color));
-                color: white;
-                padding: 3rem 1rem;
-                text-align: center;
-                position: relative;
-                box-shadow: var(--shadow);
-                animation: slideInDown 1s ease-out;
-            }
-            .header h1 {
-                font-size: 2.5rem;
-                font-weight: 700;
-                text-transform: uppercase;
-                letter-spacing: 2px;
-                text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
-            }
-            .news-content {
-                max-width: 900px;
-                margin: 3rem auto;
-                padding: 2rem;
-                background: white;
-                border-radius: 15px;
-                box-shadow: var(--shadow);
-                position: relative;
-                overflow: hidden;
-                animation: fadeInUp 1s ease-out;
-            }
-            .news-content::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                width: 100%;
-                height: 5px;
-                background: linear-gradient(90deg, var(--secondary-color), var(--accent-color));
-            }
-            .news-title {
-                font-size: 2.8rem;
-                font-weight: 700;
-                color: var(--primary-color);
-                margin-bottom: 2rem;
-                text-align: center;
-                position: relative;
-                padding-bottom: 0.5rem;
-            }
-            .news-title::after {
-                content: '';
-                position: absolute;
-                bottom: 0;
-                left: 50%;
-                transform: translateX(-50%);
-                width: 100px;
-                height: 4px;
-                background: var(--secondary-color);
-                border-radius: 2px;
-            }
-            .news-paragraph {
-                font-size: 1.2rem;
-                font-weight: 400;
-                margin: 1.5rem 0;
-                text-align: justify;
-                padding: 1rem;
-                background: var(--background-light);
-                border-radius: 10px;
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-            }
-            .news-paragraph:hover {
-                transform: translateY(-5px);
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-            }
-            .news-list-item {
-                font-size: 1.1rem;
-                font-weight: 500;
-                margin: 1rem 0;
-                padding: 1.5rem;
-                padding-left: 3rem;
-                background: linear-gradient(135deg, #dfe6e9, #b2bec3);
-                border-radius: 12px;
-                position: relative;
-                transition: transform 0.3s ease, background 0.3s ease;
-                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-            }
-            .news-list-item::before {
-                content: '➤';
-                position: absolute;
-                left: 1rem;
-                top: 50%;
-                transform: translateY(-50%);
-                color: var(--accent-color);
-                font-size: 1.2rem;
-            }
-            .news-list-item:hover {
-                transform: scale(1.02);
-                background: linear-gradient(135deg, #fab1a0, #e17055);
-                color: white;
-            }
-            @keyframes slideInDown {
-                from { transform: translateY(-100%); opacity: 0; }
-                to { transform: translateY(0); opacity: 1; }
-            }
-            @keyframes fadeInUp {
-                from { transform: translateY(50px); opacity: 0; }
-                to { transform: translateY(0); opacity: 1; }
-            }
-            @media (max-width: 768px) {
-                .header h1 { font-size: 2rem; }
-                .news-content { margin: 1.5rem; padding: 1.5rem; }
-                .news-title { font-size: 2rem; }
-                .news-paragraph { font-size: 1rem; padding: 0.8rem; }
-                .news-list-item { font-size: 1rem; padding: 1rem; padding-left: 2.5rem; }
-            }
-            @media (max-width: 480px) {
-                .header h1 { font-size: 1.5rem; }
-                .news-content { margin: 1rem; padding: 1rem; }
-                .news-title { font-size: 1.6rem; }
-                .news-paragraph { font-size: 0.9rem; }
-                .news-list-item { font-size: 0.9rem; padding: 0.8rem; padding-left: 2rem; }
-            }
-            </style>
-        '''
-
-        # Head content with title and meta description (first paragraph)
-        head_content = f'''
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{translated_content[:100]} - અમારુ એપ ગુજરાતનુ એકમાત્ર એપ છે જે દરરોજ કેટેગરી પ્રમાણે અને પ્ર્શ્નો સહિત એટલુ કરંટ અફેર ફ્રીમા આપે છે.</title>            
-            <link href="https://fonts.googleapis.com/css2?family=Hind+Vadodara:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-            {css}
-        '''
-
-        # HTML structure
-        html = f'''
-            <!DOCTYPE html>
-            <html lang="gu">
-            <head>{head_content}</head>
-            <body>
-                <header class="header"><h1>કરંટ અફેર ગુજરાતી</h1></header>
-                <article class="news-content">
-        '''
+        metrics.increment('http_requests', result='fetched')
+        metrics.increment('bytes_downloaded', len(response.content), kind='page')
+        self._store(url, response)
+        return CachedResponse(url, response.content, response.headers.get('Content-Type'))
 
-        for item in content_list:
-            if not isinstance(item, dict) or 'type' not in item or 'text' not in item:
-                logging.debug("Skipping invalid content item")
-                continue
-            text = item['text'].strip()
-            if not text:
-                logging.debug("Skipping empty text item")
-                continue
-            if item['type'] == 'heading':
-                html += f'<h1 class="news-title">{text}</h1>'
-            elif item['type'] == 'paragraph':
-                html += f'<p class="news-paragraph">{text}</p>'
-            elif item['type'] == 'list_item':
-                html += f'<div class="news-list-item">{text}</div>'
-        html += '</article></body></html>'
-        logging.debug("HTML formatting completed")
-        return html
-    except Exception as e:
-        logging.error(f"HTML formatting error: {e}")
-        logging.error(traceback.format_exc())
-        return ""
+    def prune(self, max_age_seconds):
+        """Deletes cached pages fetched more than `max_age_seconds` ago."""
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        for directory, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(directory, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.unlink(path)
+                        removed += 1
+                except OSError:
+                    pass
+        return removed
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type(mysql.connector.Error))
-def insert_news(connection, cat_id, news_title, news_description, news_image):
-    if not news_title or len(news_title.strip()) == 0:
-        logging.error("Cannot insert news with empty title")
-        return False
-    query = """
-    INSERT INTO tbl_news (cat_id, news_title, news_date, news_description, news_image, news_status, video_url, video_id, content_type, size, view_count, last_update)
-    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    def close(self):
+        self.session.close()
+
+http_client = None
+
+def get_http_client():
+    global http_client
+    if http_client is None:
+        http_client = HttpClient(HTTP_CONFIG['cache_dir'], HTTP_CONFIG['pool_size'], HTTP_CONFIG['timeout'])
+    return http_client
+
+def close_http_client():
+    global http_client
+    if http_client is not None:
+        removed = http_client.prune(HTTP_CONFIG['cache_max_age_days'] * 86400)
+        if removed:
+            logging.info(f"Pruned {removed} expired HTTP cache files")
+        http_client.close()
+        http_client = None
+
+class HostRateLimiter:
+    """Spaces out requests to the same host by at least `delay` seconds."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._locks = {}
+        self._last_request = {}
+
+    async def wait(self, url):
+        host = urlparse(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            elapsed = time.monotonic() - self._last_request.get(host, 0)
+            if elapsed < self.delay:
+                await asyncio.sleep(self.delay - elapsed)
+            self._last_request[host] = time.monotonic()
+
+def has_any_class(classes):
+    """Returns a SoupStrainer class filter that matches elements carrying any of `classes`."""
+    classes = frozenset(classes)
+    return lambda value: bool(value) and not classes.isdisjoint(value.split())
+
+def parse_html(content, parse_only=None, parser=None):
+    return BeautifulSoup(content, parser or HTML_PARSER, parse_only=parse_only)
+
+def select_first(node, selectors):
+    return next((found for selector in selectors if (found := node.select_one(selector)) is not None), None)
+
+class NewsSource:
+    """A site to scrape: where its listing pages are, how its pages are read and which articles to skip.
+
+    Selectors are CSS selectors. The strainers restrict BeautifulSoup to the
+    parts of a page the selectors need; an article page that the restricted
+    parse cannot read is parsed in full.
     """
-    current_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    data = (cat_id, news_title, current_timestamp, news_description, news_image, 1, "", "", "Post", "", 0, current_timestamp)
-    try:
-        connection = check_and_reconnect(connection)
-        if not connection:
-            logging.error("Database connection is None")
-            return False
-        cursor = connection.cursor()
-        cursor.execute(query, data)
-        connection.commit()
-        cursor.close()
-        logging.info(f"News inserted successfully: {news_title}")
-        return True
-    except mysql.connector.Error as err:
-        logging.error(f"Error inserting news: {err}")
-        logging.error(traceback.format_exc())
-        raise
 
-def send_promotional_message(channel_username, bot_token, article_titles):
-    try:
-        current_date = datetime.now().strftime('%d %B %Y')
-        message = f"🌟 **{current_date} - Current Affairs in Gujarati** 🌟\n\nHere are the latest updates:\n"
-        for i, title in enumerate(article_titles, 1):
-            message += f"\n{['📌', '🌟', '💡'][i % 3]} **{title}**"
-        message += "\n\n📱 **Download our App**: [Link]\n📣 **Join Telegram**: [https://t.me/gujtest]"
-        logging.debug(f"Preparing Telegram message: {message[:100]}...")
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        params = {'chat_id': channel_username, 'text': message, 'parse_mode': 'Markdown'}
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            logging.info("Telegram message sent successfully")
-        else:
-            logging.error(f"Failed to send Telegram message: {response.text}")
-    except Exception as e:
-        logging.error(f"Error sending Telegram message: {e}")
-        logging.error(traceback.format_exc())
+    def __init__(self, name, listing_url, listing_link_selector, content_selectors, heading_selectors, image_selector,
+                 listing_strainer=None, article_strainer=None, page_url_pattern='{listing_url}page/{page}/',
+                 category_selector='a[rel~=tag]', skip_url_patterns=(), quiz_url_patterns=(), skip_block_classes=()):
+        self.name = name
+        self.listing_url = listing_url
+        self.host = urlparse(listing_url).netloc
+        self.listing_link_selector = listing_link_selector
+        self.content_selectors = content_selectors
+        self.heading_selectors = heading_selectors
+        self.image_selector = image_selector
+        self.listing_strainer = listing_strainer
+        self.article_strainer = article_strainer
+        self.page_url_pattern = page_url_pattern
+        self.category_selector = category_selector
+        self.skip_url_patterns = list(skip_url_patterns)
+        self.quiz_url_patterns = list(quiz_url_patterns)
+        self.skip_block_classes = frozenset(skip_block_classes)
 
-class FirebaseNotificationSender:
-    def __init__(self, topic=None):
-        self.fcm_notification_topic = topic or os.getenv('FCM_NOTIFICATION_TOPIC', 'android_news_app_topic')
-        logging.debug(f"Firebase sender initialized with topic: {self.fcm_notification_topic}")
+    def listing_page_url(self, page):
+        return self.listing_url if page == 1 else self.page_url_pattern.format(listing_url=self.listing_url, page=page)
 
-    def send_notification(self, title, message, image_url=None):
-        try:
-            notification = messaging.Notification(title=title, body=message, image=image_url)
-            data = {"id": str(random.randint(1000, 9999)), "title": title, "message": message}
-            if image_url:
-                data["image"] = image_url
-            fcm_message = messaging.Message(notification=notification, data=data, topic=self.fcm_notification_topic)
-            response = messaging.send(fcm_message)
-            logging.info(f"Firebase notification sent: {response}")
-            return True, response
-        except Exception as e:
-            logging.error(f"Failed to send Firebase notification: {e}")
-            logging.error(traceback.format_exc())
-            return False, str(e)
+    def is_skipped_url(self, url):
+        return any(pattern in url for pattern in self.skip_url_patterns)
 
-def send_post_notification(combined_title, paragraph, image_name):
-    try:
-        image_url = f"https://newsadmin.currentadda.com/upload/{image_name}" if image_name else None
-        sender = FirebaseNotificationSender()
-        clean_title = combined_title[:100] if combined_title else "Current Affairs Update"
-        clean_paragraph = paragraph[:200] if paragraph else "New update available."
-        logging.debug(f"Sending Firebase notification with title: {clean_title[:50]}...")
-        success, response = sender.send_notification(clean_title, clean_paragraph, image_url)
-        if success:
-            logging.info(f"Firebase notification sent successfully: {response}")
-        else:
-            logging.error(f"Firebase notification failed: {response}")
-        return success
-    except Exception as e:
-        logging.error(f"Error in send_post_notification: {e}")
-        logging.error(traceback.format_exc())
-        return False
+    def is_quiz_url(self, url):
+        return any(pattern in url for pattern in self.quiz_url_patterns)
 
-async def scrape_and_process_article(url, connection, mongo_collection, article_titles):
-    try:
-        if is_url_scraped(mongo_collection, url):
-            logging.info(f"URL already scraped, skipping: {url}")
-            return False, None
-        
-        logging.info(f"Processing article: {url}")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        main_content = (soup.find('div', class_='inside_post column content_width') or
-                        soup.find('article') or
-                        soup.find('div', class_='content'))
+    def extract_listing_urls(self, content, backend=None, parser=None):
+        if (backend or LISTING_PARSER) == 'selectolax':
+            tree = LexborHTMLParser(content)
+            return [href for node in tree.css(self.listing_link_selector) if (href := node.attributes.get('href'))]
+        soup = parse_html(content, self.listing_strainer, parser)
+        return [a_tag['href'] for a_tag in soup.select(self.listing_link_selector) if a_tag.get('href')]
+
+    def extract_article(self, soup):
+        main_content = select_first(soup, self.content_selectors)
         if not main_content:
-            logging.error("No main content found")
-            return False, None
-        first_paragraph = main_content.find('p')
-        first_paragraph_translated = translate_to_gujarati(first_paragraph.get_text().strip()) if first_paragraph else "No introductory text available."
-        logging.debug(f"First paragraph translated: {first_paragraph_translated[:50]}...")
-        featured_image_div = soup.find('div', class_='featured_image')
-        image_filename = None
-        if featured_image_div and (img_tag := featured_image_div.find('img')) and img_tag.get('src'):
-            image_filename = download_and_process_image(img_tag['src'])
-        heading = (main_content.find('h1', id='list') or main_content.find('h1') or soup.find('title'))
+            return None
+        heading = select_first(main_content, self.heading_selectors) or soup.find('title')
         if not heading:
-            logging.error("No heading found")
-            return False, None
-        original_heading = heading.get_text().strip()
-        translated_heading = translate_to_gujarati(original_heading)
-        combined_heading = f"{original_heading} - {translated_heading}"
-        logging.debug(f"Combined heading: {combined_heading[:50]}...")
-        content_list = [{'type': 'heading', 'text': combined_heading}]
+            return None
+        first_paragraph = main_content.find('p')
+        categories = [a_tag.get_text().strip() for a_tag in main_content.select(self.category_selector)]
+        img_tag = soup.select_one(self.image_selector)
+        image_url = img_tag['src'] if img_tag is not None and img_tag.get('src') else None
+        blocks = []
         for tag in main_content.find_all(recursive=False):
-            if tag.get('class') in [['sharethis-inline-share-buttons'], ['prenext']]:
+            if not self.skip_block_classes.isdisjoint(tag.get('class') or ()):
                 continue
-            text = tag.get_text().strip()
-            if not text:
-                continue
-            translated_text = translate_to_gujarati(text)
             if tag.name == 'p':
-                content_list.append({'type': 'paragraph', 'text': translated_text})
+                if text := tag.get_text().strip():
+                    blocks.append({'type': 'paragraph', 'text': text})
             elif tag.name == 'ul':
                 for li in tag.find_all('li'):
                     if li_text := li.get_text().strip():
-                        content_list.append({'type': 'list_item', 'text': translate_to_gujarati(li_text)})
-        news_description = " ".join(item['text'] for item in content_list if item['type'] == 'paragraph')
-        cat_id = next((id for cat, id in CATEGORY_MAP.items() if cat in news_description), 1)
-        formatted_html = format_content_as_html(content_list)
-        if not formatted_html:
-            logging.error("Failed to format HTML content")
-            return False, None
-        success = insert_news(connection, cat_id, combined_heading, formatted_html, image_filename)
-        if success and combined_heading:
-            send_post_notification(combined_heading, first_paragraph_translated, image_filename)
-            log_scraped_url(mongo_collection, url)  # Log URL to MongoDB after successful processing
-            return True, combined_heading
-        logging.warning("Failed to insert news into database")
-        return False, None
-    except Exception as e:
-        logging.error(f"Error processing article {url}: {e}")
-        logging.error(traceback.format_exc())
-        return False, None
+                        blocks.append({'type': 'list_item', 'text': li_text})
+        return {
+            'heading': heading.get_text().strip(),
+            'first_paragraph': first_paragraph.get_text().strip() if first_paragraph else "",
+            'image_url': image_url,
+            'categories': categories,
+            'blocks': blocks
+        }
+
+    def parse_article(self, content, parser=None):
+        article = self.extract_article(parse_html(content, self.article_strainer, parser))
+        if article is None and self.article_strainer is not None:
+            # Pages without the usual content div fall back to the later selectors or <title>
+            logging.debug("Restricted parse found no article content, parsing the full page")
+            article = self.extract_article(parse_html(content, parser=parser))
+        if article is None:
+            logging.error(f"No article content or heading found on {self.name} page")
+        return article
+
+# Registered sites, selected with NEWS_SOURCES. A new site needs its listing URL,
+# pagination pattern and selectors; translation, images and persistence are shared.
+SOURCES = {
+    'gktoday': NewsSource(
+        'gktoday',
+        listing_url='https://www.gktoday.in/current-affairs/',
+        listing_link_selector='h1#list > a',
+        listing_strainer=SoupStrainer('h1', id='list'),
+        content_selectors=['div.inside_post.column.content_width', 'article', 'div.content'],
+        heading_selectors=['h1#list', 'h1'],
+        image_selector='div.featured_image img',
+        # Keeps only the content and featured image subtrees of an article page
+        article_strainer=SoupStrainer(class_=has_any_class({'inside_post', 'featured_image', 'content'})),
+        # Quiz pages are not published as news; their questions go to the summary sidecar
+        quiz_url_patterns=['daily-current-affairs-quiz'],
+        skip_block_classes=['sharethis-inline-share-buttons', 'prenext']
+    )
+}
+
+def enabled_sources():
+    unknown = [name for name in SCRAPER_CONFIG['sources'] if name not in SOURCES]
+    if unknown:
+        raise ValueError(f"Unknown news sources: {', '.join(unknown)} (registered: {', '.join(SOURCES)})")
+    return [SOURCES[name] for name in SCRAPER_CONFIG['sources']]
 
-async def main():
-    connection = None
-    mongo_client = None
+def source_for_url(url):
+    host = urlparse(url).netloc
+    return next((source for source in SOURCES.values() if source.host == host), None)
+
+def fetch_listing_page(source, page):
+    url = source.listing_page_url(page)
     try:
-        logging.info("Starting news scraper")
-        connection = create_db_connection()
-        if not connection:
-            raise Exception("Failed to establish initial database connection")
-        
-        mongo_client, mongo_collection = create_mongo_connection()
-        if not mongo_client:
-            raise Exception("Failed to establish MongoDB connection")
-        
-        base_url = "https://www.gktoday.in/current-affairs/"
-        article_urls = fetch_article_urls(base_url, 1)
-        article_titles = []
-        for url in article_urls:
-            if 'daily-current-affairs-quiz' not in url:
-                success, combined_title = await scrape_and_process_article(url, connection, mongo_collection, article_titles)
-                if success and combined_title:
-                    article_titles.append(combined_title)
-                    logging.debug(f"Added title to list: {combined_title[:50]}...")
-                await asyncio.sleep(2)
-        if article_titles:
-            logging.info(f"Sending Telegram message with {len(article_titles)} titles")
-            send_promotional_message(TELEGRAM_CHANNEL, TELEGRAM_BOT_TOKEN, article_titles)
+        response = get_http_client().get_page(url)
+        page_articles = source.extract_listing_urls(response.content)
+        logging.info(f"Found {len(page_articles)} articles on {source.name} page {page}")
+        return [url for url in page_articles if not source.is_skipped_url(url)]
+    except requests.RequestException as e:
+        logging.error(f"Error fetching {source.name} page {page}: {e}")
+        return None
+
+async def fetch_article_urls(source, pages, url_store, rate_limiter, concurrency, backfill=False):
+    """Returns the not-yet-scraped article URLs from up to `pages` of a source's listing pages.
+
+    Incremental mode fetches pages in windows of `concurrency` and stops after the
+    first page whose articles are all already known. Backfill mode fetches every
+    page concurrently. Request starts are spaced out by `rate_limiter`, which
+    should be the listing limiter rather than the article one; the requests
+    themselves overlap.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    logging.info(f"Fetching article URLs from {source.listing_url} for up to {pages} pages ({'backfill' if backfill else 'incremental'})")
+
+    async def fetch(page):
+        async with semaphore:
+            await rate_limiter.wait(source.listing_url)
+            return await asyncio.to_thread(fetch_listing_page, source, page)
+
+    if backfill:
+        results = await asyncio.gather(*(fetch(page) for page in range(1, pages + 1)))
+        return await asyncio.to_thread(url_store.filter_new, [url for page_urls in results if page_urls for url in page_urls])
+    article_urls = []
+    seen = set()
+    for window_start in range(1, pages + 1, concurrency):
+        window = range(window_start, min(window_start + concurrency, pages + 1))
+        results = await asyncio.gather(*(fetch(page) for page in window))
+        for page, page_urls in zip(window, results):
+            if page_urls is None:
+                continue
+            new_urls = await asyncio.to_thread(url_store.filter_new, page_urls)
+            article_urls.extend(url for url in new_urls if url not in seen)
+            seen.update(new_urls)
+            if not new_urls:
+                logging.info(f"Every article on {source.name} page {page} is already scraped, stopping")
+                return article_urls
+    return article_urls
+
+async def fetch_new_article_urls(sources, pages, url_store, rate_limiter, concurrency, backfill=False):
+    """Crawls the listing pages of every source concurrently and merges their new article URLs."""
+    results = await asyncio.gather(
+        *(fetch_article_urls(source, pages, url_store, rate_limiter, concurrency, backfill) for source in sources),
+        return_exceptions=True
+    )
+    for source, result in zip(sources, results):
+        if isinstance(result, Exception):
+            logging.error(f"Error crawling {source.name}: {result}")
+    # Alternates between sources so the fetch workers spread their requests over the hosts
+    per_source = [result for result in results if not isinstance(result, Exception)]
+    return [url for urls in itertools.zip_longest(*per_source) for url in urls if url]
+
+class TranslationCache:
+    """SQLite-backed translation cache shared across runs and worker processes."""
+
+    def __init__(self, path, max_entries, ttl_seconds, source, target):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.source = source
+        self.target = target
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, translated TEXT NOT NULL, created_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)")
+        self._connection.commit()
+        logging.info(f"Translation cache opened at {path}")
+
+    def _key(self, text):
+        return hashlib.sha256(f"{self.source}:{self.target}:{text}".encode()).hexdigest()
+
+    def get_many(self, texts):
+        """Returns a {text: translation} dict for the texts that have a fresh cached translation."""
+        keys = {self._key(text): text for text in texts}
+        found = {}
+        now = time.time()
+        with self._lock:
+            key_list = list(keys)
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                rows = self._connection.execute(
+                    f"SELECT key, translated FROM translations WHERE created_at >= ? AND key IN ({','.join('?' * len(chunk))})",
+                    [now - self.ttl_seconds] + chunk
+                ).fetchall()
+                for key, translated in rows:
+                    found[keys[key]] = translated
+                self._connection.executemany(
+                    "UPDATE translations SET last_used = ? WHERE key = ?",
+                    [(now, key) for key, _ in rows]
+                )
+            self._connection.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        metrics.increment('translation_cache', len(found), result='hit')
+        metrics.increment('translation_cache', len(keys) - len(found), result='miss')
+        return found
+
+    def set_many(self, translations):
+        now = time.time()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO translations (key, translated, created_at, last_used) VALUES (?, ?, ?, ?)",
+                [(self._key(text), translated, now, now) for text, translated in translations.items()]
+            )
+            self._connection.commit()
+
+    def evict(self):
+        """Drops expired entries, then the least recently used ones above the size cap."""
+        with self._lock:
+            expired = self._connection.execute(
+                "DELETE FROM translations WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+            overflow = self._connection.execute(
+                "DELETE FROM translations WHERE key IN ("
+                "SELECT key FROM translations ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            ).rowcount
+            self._connection.commit()
+        logging.info(f"Translation cache evicted {expired} expired and {overflow} least recently used entries")
+
+    def stats(self):
+        with self._lock:
+            entries = self._connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+translation_cache = None
+
+def get_translation_cache():
+    global translation_cache
+    if translation_cache is None:
+        translation_cache = TranslationCache(
+            TRANSLATION_CONFIG['cache_path'],
+            TRANSLATION_CONFIG['cache_max_entries'],
+            TRANSLATION_CONFIG['cache_ttl_days'] * 86400,
+            TRANSLATION_CONFIG['source'],
+            TRANSLATION_CONFIG['target']
+        )
+    return translation_cache
+
+def close_translation_cache():
+    global translation_cache
+    if translation_cache is not None:
+        translation_cache.evict()
+        stats = translation_cache.stats()
+        metrics.set_gauge('translation_cache_hit_ratio', stats['hit_ratio'])
+        metrics.set_gauge('translation_cache_entries', stats['entries'])
+        logging.info(f"Translation cache stats: {stats}")
+        translation_cache.close()
+        translation_cache = None
+
+def split_long_text(text, limit):
+    """Splits text longer than `limit` at sentence boundaries, hard-splitting oversized sentences."""
+    if len(text) <= limit:
+        return [text]
+    pieces = []
+    current = ""
+    for sentence in re.split(r'(?<=[.!?])\s+', text):
+        while len(sentence) > limit:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:limit])
+            sentence = sentence[limit:]
+        if current and len(current) + 1 + len(sentence) > limit:
+            pieces.append(current)
+            current = sentence
         else:
-            logging.warning("No article titles to send in Telegram message")
-    except Exception as e:
-        logging.error(f"Main execution error: {e}")
-        logging.error(traceback.format_exc())
-        raise
-    finally:
-        if connection:
-            connection.close()
-            logging.info("Database connection closed")
-        if mongo_client:
-            mongo_client.close()
-            logging.info("MongoDB connection closed")
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+def pack_batches(pieces, limit):
+    """Groups pieces into consecutive batches whose delimiter-joined length stays within `limit`."""
+    batches = []
+    batch = []
+    batch_length = 0
+    for piece in pieces:
+        added_length = len(piece) + (len(TRANSLATION_DELIMITER) if batch else 0)
+        if batch and batch_length + added_length > limit:
+            batches.append(batch)
+            batch = []
+            batch_length = 0
+            added_length = len(piece)
+        batch.append(piece)
+        batch_length += added_length
+    if batch:
+        batches.append(batch)
+    return batches
+
+class TranslationUnavailable(Exception):
+    """Raised when the translation backend cannot be used right now; retry after `retry_after` seconds."""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class TranslationInputError(Exception):
+    """Raised when the backend rejects the text itself; retrying later will not help."""
+
+def translate_batch(translator, batch):
+    """Translates a batch of single-line pieces in one request, falling back to one request per piece.
+
+    Returns the translations and the set of positions the backend rejected as
+    invalid input. Pieces that cannot be translated come back as None so
+    they are never cached.
+    """
+    if len(batch) > 1:
+        try:
+            translated = translator.translate(TRANSLATION_DELIMITER.join(batch))
+            parts = [part.strip() for part in translated.split(TRANSLATION_DELIMITER) if part.strip()]
+            if len(parts) == len(batch):
+                return parts, set()
+            logging.warning(f"Batch translation returned {len(parts)} parts for {len(batch)} pieces, translating one by one")
+        except TranslationUnavailable:
+            raise
+        except Exception as e:
+            logging.warning(f"Batch translation error: {e}, translating one by one")
+    results = []
+    rejected = set()
+    for position, piece in enumerate(batch):
+        try:
+            translated = translator.translate(piece)
+        except TranslationUnavailable:
+            raise
+        except Exception as e:
+            logging.warning(f"Translation error: {e}")
+            if is_translation_input_error(e):
+                rejected.add(position)
+            results.append(None)
+            continue
+        if translated is None:
+            # deep-translator returns None for input it considers untranslatable
+            rejected.add(position)
+        results.append(translated)
+    return results, rejected
+
+class StubTranslator:
+    """Offline backend that returns the text unchanged, for local runs and benchmarks."""
+
+    def translate(self, text):
+        return text
+
+def deep_translator_backend(class_name, **options):
+    def create(config):
+        import deep_translator
+        return getattr(deep_translator, class_name)(source=config['source'], target=config['target'],
+                                                    **{key: config[value] for key, value in options.items()})
+    return create
+
+TRANSLATION_BACKENDS = {
+    'google': deep_translator_backend('GoogleTranslator'),
+    'mymemory': deep_translator_backend('MyMemoryTranslator'),
+    'libre': deep_translator_backend('LibreTranslator', api_key='api_key', custom_url='base_url'),
+    'microsoft': deep_translator_backend('MicrosoftTranslator', api_key='api_key', region='region'),
+    'stub': lambda config: StubTranslator()
+}
+
+def is_translation_input_error(exception):
+    """True for errors caused by the text itself, which say nothing about the backend's health."""
+    try:
+        from deep_translator.exceptions import NotValidLength, NotValidPayload
+    except ImportError:
+        return False
+    return isinstance(exception, (NotValidLength, NotValidPayload))
+
+class TokenBucket:
+    """Thread-safe token bucket; `acquire` blocks until a token is available."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class TranslationClient:
+    """Rate-limited front end for a translation backend that adapts to how the backend copes.
+
+    Requests draw from a token bucket whose rate grows additively while
+    requests succeed within the latency target and halves on every failure.
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests fail fast with TranslationUnavailable for the cooldown; one probe
+    request is then let through, and a failed probe doubles the cooldown.
+    """
+
+    def __init__(self, backend, config):
+        self.backend = backend
+        self.min_rate = config['min_rate']
+        self.max_rate = config['max_rate']
+        self.latency_target = config['latency_target']
+        self.failure_threshold = config['failure_threshold']
+        self.base_cooldown = config['cooldown']
+        self.max_cooldown = config['max_cooldown']
+        self.bucket = TokenBucket(min(max(config['rate'], self.min_rate), self.max_rate), config['burst'])
+        self.cooldown = self.base_cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._latency = None
+        self._lock = threading.Lock()
+
+    def retry_after(self):
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+
+    def _before_request(self):
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            remaining = self._opened_at + self.cooldown - time.monotonic()
+            if remaining > 0 or self._probing:
+                raise TranslationUnavailable("Translation circuit is open", max(remaining, 1.0))
+            self._probing = True
+            return True
+
+    def _set_rate(self, rate):
+        self.bucket.rate = min(max(rate, self.min_rate), self.max_rate)
+        metrics.set_gauge('translate_rate', round(self.bucket.rate, 3))
+
+    def _record_success(self, latency):
+        with self._lock:
+            self._failures = 0
+            if self._opened_at is not None:
+                logging.info("Translation backend recovered, closing the circuit")
+                metrics.increment('translate_circuit', state='closed')
+                self._opened_at = None
+                self._probing = False
+                self.cooldown = self.base_cooldown
+            self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+            if self._latency > self.latency_target:
+                self._set_rate(self.bucket.rate * 0.8)
+            else:
+                self._set_rate(self.bucket.rate + self.max_rate / 20)
+
+    def _record_failure(self, error, probe):
+        with self._lock:
+            self._failures += 1
+            self._set_rate(self.bucket.rate / 2)
+            if probe:
+                self._probing = False
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                self._opened_at = time.monotonic()
+            elif self._opened_at is None and self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            else:
+                return
+        logging.warning(f"Translation circuit open for {self.cooldown:.0f}s after {self._failures} failures, last: {error}")
+        metrics.increment('translate_circuit', state='open')
+
+    def translate(self, text):
+        probe = self._before_request()
+        self.bucket.acquire()
+        start = time.perf_counter()
+        try:
+            result = self.backend.translate(text)
+        except Exception as e:
+            if is_translation_input_error(e):
+                if probe:
+                    with self._lock:
+                        self._probing = False
+                raise
+            metrics.increment('translate_errors')
+            self._record_failure(e, probe)
+            raise
+        self._record_success(time.perf_counter() - start)
+        return result
+
+translation_client = None
+
+def get_translation_client():
+    global translation_client
+    if translation_client is None:
+        name = TRANSLATION_CONFIG['backend']
+        if name not in TRANSLATION_BACKENDS:
+            raise ValueError(f"Unknown translation backend {name!r} (available: {', '.join(TRANSLATION_BACKENDS)})")
+        translation_client = TranslationClient(TRANSLATION_BACKENDS[name](TRANSLATION_CONFIG), TRANSLATION_CONFIG)
+        logging.info(f"Translation backend: {name}")
+    return translation_client
+
+def translate_texts(texts):
+    """Translates a list of texts to Gujarati with as few round trips as possible, preserving order.
+
+    Texts without any letters are returned unchanged. Raises
+    TranslationUnavailable when the backend failed and TranslationInputError
+    when it rejected a text, rather than returning any text untranslated.
+    """
+    cache = get_translation_cache()
+    unique_texts = [text for text in dict.fromkeys(texts) if needs_translation(text)]
+    translations = cache.get_many(unique_texts)
+    pending = [text for text in unique_texts if text not in translations]
+    if pending:
+        limit = TRANSLATION_CONFIG['batch_chars']
+        # Newlines delimit the pieces of a batch, so they cannot appear inside a piece
+        owners = []
+        pieces = []
+        for index, text in enumerate(pending):
+            for piece in split_long_text(" ".join(text.split()), limit):
+                owners.append(index)
+                pieces.append(piece)
+        translator = get_translation_client()
+        translated_pieces = []
+        rejected_pieces = set()
+        batches = pack_batches(pieces, limit)
+        logging.debug("Translating %d texts in %d batches", len(pending), len(batches))
+        try:
+            for batch in batches:
+                with metrics.timer('translate_request'):
+                    results, rejected = translate_batch(translator, batch)
+                rejected_pieces.update(len(translated_pieces) + position for position in rejected)
+                translated_pieces.extend(results)
+                metrics.increment('translated_chars', sum(len(piece) for piece in batch))
+        finally:
+            # Texts finished before the circuit opened are cached, so the retry does not request them again
+            piece_counts = Counter(owners)
+            translated_texts = [[] for _ in pending]
+            for index, translated in zip(owners, translated_pieces):
+                translated_texts[index].append(translated)
+            fresh = {
+                text: " ".join(parts) for index, (text, parts) in enumerate(zip(pending, translated_texts))
+                if len(parts) == piece_counts[index] and None not in parts
+            }
+            cache.set_many(fresh)
+            translations.update(fresh)
+        rejected_texts = {owners[position] for position in rejected_pieces}
+        failed = len(pending) - len(fresh) - len(rejected_texts)
+        if failed:
+            # Never hand back English in place of a translation; the caller waits and tries again
+            raise TranslationUnavailable(
+                f"{failed} of {len(pending)} texts could not be translated",
+                max(translator.retry_after(), 1 / translator.bucket.rate)
+            )
+        if rejected_texts:
+            metrics.increment('translate_rejected', len(rejected_texts))
+            raise TranslationInputError(
+                f"Backend rejected {len(rejected_texts)} of {len(pending)} texts, "
+                f"first: {pending[min(rejected_texts)][:100]!r}"
+            )
+    return [translations.get(text, text) if needs_translation(text) else text for text in texts]
+
+def needs_translation(text):
+    """False for empty text and text without letters (numbers, punctuation), which is kept as is."""
+    return bool(text) and re.search(r'[^\W\d_]', text) is not None
+
+class TranslationBatcher:
+    """Coalesces translation requests from concurrent article workers into shared batches."""
+
+    def __init__(self, window):
+        self.window = window
+        self._pending = []
+        self._flush_task = None
+
+    async def translate(self, texts):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((texts, future))
+        if not self._flush_task:
+            self._flush_task = asyncio.create_task(self._flush_later())
+        return await future
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.window)
+        pending, self._pending = self._pending, []
+        self._flush_task = None
+        all_texts = [text for texts, _ in pending for text in texts]
+        try:
+            translated = await asyncio.to_thread(translate_texts, all_texts)
+        except TranslationInputError:
+            # Only the requests holding a rejected text should fail; the other texts are cached by now
+            for texts, future in pending:
+                try:
+                    future.set_result(await asyncio.to_thread(translate_texts, texts))
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        position = 0
+        for texts, future in pending:
+            future.set_result(translated[position:position + len(texts)])
+            position += len(texts)
+
+class FtpPool:
+    """Keeps a small pool of authenticated FTP sessions alive for the whole run.
+
+    Idle sessions are checked with NOOP before reuse and replaced only when
+    the check fails; a session that errors during a transfer is discarded.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self._idle = []
+        self._created = 0
+        self._condition = threading.Condition()
+
+    def _connect(self):
+        ftp = ftplib.FTP(timeout=self.config['timeout'])
+        ftp.connect(self.config['host'], self.config['port'])
+        ftp.login(self.config['user'], self.config['password'])
+        ftp.cwd(self.config['upload_path'])
+        logging.debug("FTP session opened")
+        return ftp
+
+    def _discard(self, ftp):
+        try:
+            ftp.close()
+        except ftplib.all_errors:
+            pass
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    def _acquire(self):
+        with self._condition:
+            while not self._idle and self._created >= self.config['pool_size']:
+                self._condition.wait()
+            if self._idle:
+                ftp, last_used = self._idle.pop()
+            else:
+                self._created += 1
+                ftp, last_used = None, None
+        if ftp is not None:
+            if time.monotonic() - last_used < self.config['noop_after']:
+                return ftp
+            try:
+                ftp.voidcmd('NOOP')
+                return ftp
+            except ftplib.all_errors as e:
+                logging.info(f"Stale FTP session ({e}), reconnecting")
+                try:
+                    ftp.close()
+                except ftplib.all_errors:
+                    pass
+        try:
+            return self._connect()
+        except BaseException:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+    @contextmanager
+    def session(self):
+        ftp = self._acquire()
+        try:
+            yield ftp
+        except BaseException:
+            self._discard(ftp)
+            raise
+        with self._condition:
+            self._idle.append((ftp, time.monotonic()))
+            self._condition.notify()
+
+    def upload(self, filename, file):
+        with self.session() as ftp, metrics.timer('ftp_upload'):
+            ftp.storbinary(f'STOR {filename}', file)
+        metrics.increment('bytes_uploaded', file.tell(), kind='ftp')
+
+    def close(self):
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+        for ftp, _ in idle:
+            try:
+                ftp.quit()
+            except ftplib.all_errors:
+                ftp.close()
+        logging.debug("Closed %d FTP sessions", len(idle))
+
+def download_image(image_url, max_bytes):
+    with get_http_client().session.get(image_url, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.write(chunk)
+            if buffer.tell() > max_bytes:
+                raise ValueError(f"Image larger than {max_bytes} bytes: {image_url}")
+    metrics.increment('bytes_downloaded', buffer.tell(), kind='image')
+    return buffer.getvalue()
+
+def encode_image(data, config):
+    """Downscales an image to the configured width and encodes it in memory; returns (buffer, extension)."""
+    from PIL import Image, features
+    output_format = config['format']
+    if output_format == 'webp' and not features.check('webp'):
+        logging.warning("Pillow was built without WebP support, falling back to JPEG")
+        output_format = 'jpeg'
+    pillow_format, extension, save_options = IMAGE_FORMATS[output_format]
+    img = Image.open(io.BytesIO(data))
+    # Lets the JPEG decoder skip detail that the resize below would throw away
+    img.draft('RGB', (config['max_width'], config['max_width'] * img.height // max(img.width, 1)))
+    img = img.convert('RGB')
+    if img.width > config['max_width']:
+        height = round(img.height * config['max_width'] / img.width)
+        img = img.resize((config['max_width'], height), Image.LANCZOS)
+    buffer = io.BytesIO()
+    if pillow_format == 'PNG':
+        img.save(buffer, pillow_format, **save_options)
+    else:
+        img.save(buffer, pillow_format, quality=config['quality'], **save_options)
+    buffer.seek(0)
+    return buffer, extension
+
+class ImageIndex:
+    """Maps image source URLs and content hashes to files already uploaded to the FTP server."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.collection.create_index('content_hash', unique=True)
+        self.collection.create_index('source_urls')
+
+    def find_by_url(self, image_url):
+        try:
+            document = self.collection.find_one({'source_urls': image_url}, {'filename': 1})
+            return document['filename'] if document else None
+        except Exception as e:
+            logging.error(f"Error looking up image URL in MongoDB: {e}")
+            return None
+
+    def find_by_hash(self, content_hash):
+        try:
+            document = self.collection.find_one({'content_hash': content_hash}, {'filename': 1})
+            return document['filename'] if document else None
+        except Exception as e:
+            logging.error(f"Error looking up image hash in MongoDB: {e}")
+            return None
+
+    def add(self, content_hash, filename, image_url):
+        try:
+            self.collection.update_one(
+                {'content_hash': content_hash},
+                {'$setOnInsert': {'filename': filename, 'created_at': datetime.utcnow()},
+                 '$addToSet': {'source_urls': image_url}},
+                upsert=True
+            )
+        except Exception as e:
+            logging.error(f"Error recording image hash in MongoDB: {e}")
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception_type((requests.RequestException, ftplib.all_errors)), before_sleep=count_retry('download_and_process_image'))
+def download_and_process_image(image_url, ftp_pool, image_index):
+    try:
+        if filename := image_index.find_by_url(image_url):
+            logging.info(f"Image already uploaded as {filename}, skipping download: {image_url}")
+            metrics.increment('image_reuse', match='url')
+            return filename
+        logging.info(f"Downloading image from: {image_url}")
+        data = download_image(image_url, IMAGE_CONFIG['max_bytes'])
+        content_hash = hashlib.sha256(data).hexdigest()
+        if filename := image_index.find_by_hash(content_hash):
+            logging.info(f"Identical image already uploaded as {filename}: {image_url}")
+            metrics.increment('image_reuse', match='content')
+            image_index.add(content_hash, filename, image_url)
+            return filename
+        buffer, extension = encode_image(data, IMAGE_CONFIG)
+        logging.debug("Encoded image from %d to %d bytes", len(data), buffer.getbuffer().nbytes)
+        # Content-addressed, so concurrent uploads of the same picture write the same file
+        filename = f"news_{content_hash[:16]}.{extension}"
+        ftp_pool.upload(filename, buffer)
+        image_index.add(content_hash, filename, image_url)
+        logging.info(f"Image uploaded as: {filename}")
+        return filename
+    except Exception as e:
+        logging.error(f"Image processing error: {e}")
+        raise
+
+NEWS_CSS = """
+:root {
+    --primary-color: #2c3e50;
+    --secondary-color: #e74c3c;
+    --accent-color: #f1c40f;
+    --background-light: #ecf0f1;
+    --text-dark: #34495e;
+    --shadow: 0 8px 16px rgba(0, 0, 0, 0.2);
+}
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+body {
+    font-family: 'Hind Vadodara', sans-serif;
+    background: linear-gradient(135deg, #bdc3c7, #2c3e50);
+    color: var(--text-dark);
+    line-height: 1.8;
+    overflow-x: hidden;
+}
+.header {
+    background: linear-gradient(90deg, var(--primary-color), var(--secondary-color));
+    color: white;
+    padding: 3rem 1rem;
+    text-align: center;
+    position: relative;
+    box-shadow: var(--shadow);
+    animation: slideInDown 1s ease-out;
+}
+.header h1 {
+    font-size: 2.5rem;
+    font-weight: 700;
+    text-transform: uppercase;
+    letter-spacing: 2px;
+    text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
+}
+.news-content {
+    max-width: 900px;
+    margin: 3rem auto;
+    padding: 2rem;
+    background: white;
+    border-radius: 15px;
+    box-shadow: var(--shadow);
+    position: relative;
+    overflow: hidden;
+    animation: fadeInUp 1s ease-out;
+}
+.news-content::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 5px;
+    background: linear-gradient(90deg, var(--secondary-color), var(--accent-color));
+}
+.news-title {
+    font-size: 2.8rem;
+    font-weight: 700;
+    color: var(--primary-color);
+    margin-bottom: 2rem;
+    text-align: center;
+    position: relative;
+    padding-bottom: 0.5rem;
+}
+.news-title::after {
+    content: '';
+    position: absolute;
+    bottom: 0;
+    left: 50%;
+    transform: translateX(-50%);
+    width: 100px;
+    height: 4px;
+    background: var(--secondary-color);
+    border-radius: 2px;
+}
+.news-paragraph {
+    font-size: 1.2rem;
+    font-weight: 400;
+    margin: 1.5rem 0;
+    text-align: justify;
+    padding: 1rem;
+    background: var(--background-light);
+    border-radius: 10px;
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+}
+.news-paragraph:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
+}
+.news-list-item {
+    font-size: 1.1rem;
+    font-weight: 500;
+    margin: 1rem 0;
+    padding: 1.5rem;
+    padding-left: 3rem;
+    background: linear-gradient(135deg, #dfe6e9, #b2bec3);
+    border-radius: 12px;
+    position: relative;
+    transition: transform 0.3s ease, background 0.3s ease;
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
+}
+.news-list-item::before {
+    content: '➤';
+    position: absolute;
+    left: 1rem;
+    top: 50%;
+    transform: translateY(-50%);
+    color: var(--accent-color);
+    font-size: 1.2rem;
+}
+.news-list-item:hover {
+    transform: scale(1.02);
+    background: linear-gradient(135deg, #fab1a0, #e17055);
+    color: white;
+}
+@keyframes slideInDown {
+    from { transform: translateY(-100%); opacity: 0; }
+    to { transform: translateY(0); opacity: 1; }
+}
+@keyframes fadeInUp {
+    from { transform: translateY(50px); opacity: 0; }
+    to { transform: translateY(0); opacity: 1; }
+}
+@media (max-width: 768px) {
+    .header h1 { font-size: 2rem; }
+    .news-content { margin: 1.5rem; padding: 1.5rem; }
+    .news-title { font-size: 2rem; }
+    .news-paragraph { font-size: 1rem; padding: 0.8rem; }
+    .news-list-item { font-size: 1rem; padding: 1rem; padding-left: 2.5rem; }
+}
+@media (max-width: 480px) {
+    .header h1 { font-size: 1.5rem; }
+    .news-content { margin: 1rem; padding: 1rem; }
+    .news-title { font-size: 1.6rem; }
+    .news-paragraph { font-size: 0.9rem; }
+    .news-list-item { font-size: 0.9rem; padding: 0.8rem; padding-left: 2rem; }
+}
+"""
+
+NEWS_FONTS_HREF = "https://fonts.googleapis.com/css2?family=Hind+Vadodara:wght@300;400;500;600;700&display=swap"
+NEWS_TITLE_SUFFIX = " - અમારુ એપ ગુજરાતનુ એકમાત્ર એપ છે જે દરરોજ કેટેગરી પ્રમાણે અને પ્ર્શ્નો સહિત એટલુ કરંટ અફેર ફ્રીમા આપે છે."
+
+NEWS_BLOCK_TEMPLATES = {
+    'heading': '<h1 class="news-title">{}</h1>',
+    'paragraph': '<p class="news-paragraph">{}</p>',
+    'list_item': '<div class="news-list-item">{}</div>'
+}
+
+class NewsRenderer:
+    """Renders article pages from a template compiled once per run.
+
+    With a stylesheet URL the page links to a shared, cacheable stylesheet
+    instead of inlining NEWS_CSS into every stored row.
+    """
+
+    def __init__(self, stylesheet_url=None):
+        if stylesheet_url:
+            styles = f'<link href="{html.escape(stylesheet_url)}" rel="stylesheet">'
+        else:
+            styles = f"<style>{' '.join(NEWS_CSS.split())}</style>"
+        self._before_title = (
+            '<!DOCTYPE html><html lang="gu"><head><meta charset="UTF-8">'
+            '<meta name="viewport" content="width=device-width, initial-scale=1.0"><title>'
+        )
+        self._after_title = (
+            f'{html.escape(NEWS_TITLE_SUFFIX, quote=False)}</title>'
+            f'<link href="{html.escape(NEWS_FONTS_HREF)}" rel="stylesheet">{styles}</head>'
+            '<body><header class="header"><h1>કરંટ અફેર ગુજરાતી</h1></header><article class="news-content">'
+        )
+        self._suffix = '</article></body></html>'
+
+    def render(self, content_list):
+        title = next((item['text'] for item in content_list if item.get('type') in ['heading', 'paragraph'] and item.get('text')), "Article")
+        parts = [self._before_title, html.escape(title[:100], quote=False), self._after_title]
+        for item in content_list:
+            if not isinstance(item, dict) or 'type' not in item or 'text' not in item:
+                logging.debug("Skipping invalid content item")
+                continue
+            template = NEWS_BLOCK_TEMPLATES.get(item['type'])
+            text = item['text'].strip()
+            if template and text:
+                parts.append(template.format(html.escape(text, quote=False)))
+        parts.append(self._suffix)
+        return ''.join(parts)
+
+def publish_stylesheet(ftp_pool):
+    """Uploads NEWS_CSS under a content-hashed name unless it is already on the server; returns its URL."""
+    css = NEWS_CSS.encode()
+    filename = f"news_{hashlib.sha256(css).hexdigest()[:12]}.css"
+    with ftp_pool.session() as ftp:
+        try:
+            # Some servers refuse SIZE in ASCII mode
+            ftp.voidcmd('TYPE I')
+            ftp.size(filename)
+            logging.info(f"Stylesheet already published as {filename}")
+        except ftplib.error_perm:
+            ftp.storbinary(f'STOR {filename}', io.BytesIO(css))
+            logging.info(f"Stylesheet published as {filename}")
+    return f"{RENDER_CONFIG['asset_base_url']}{filename}"
+
+def format_content_as_html(content_list, renderer):
+    try:
+        html_content = renderer.render(content_list)
+        logging.debug("HTML formatting completed")
+        return html_content
+    except Exception as e:
+        logging.error(f"HTML formatting error: {e}")
+        logging.error(traceback.format_exc())
+        return ""
+
+class NewsWriter:
+    """Collects tbl_news rows and writes each batch with executemany in a single transaction.
+
+    Callbacks registered with a row run only after its batch has been committed,
+    or after the row has failed for good. A batch that still fails after the
+    retries is written again one row at a time, so a single bad row does not
+    fail the rest of its batch.
+    """
+
+    query = """
+    INSERT INTO tbl_news (cat_id, news_title, news_date, news_description, news_image, news_status, video_url, video_id, content_type, size, view_count, last_update)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """
+
+    def __init__(self, pool, batch_size):
+        self.pool = pool
+        self.batch_size = batch_size
+        self._rows = []
+        self._lock = threading.Lock()
+
+    def add(self, cat_id, news_title, news_description, news_image, on_commit=None, on_failure=None):
+        if not news_title or len(news_title.strip()) == 0:
+            logging.error("Cannot insert news with empty title")
+            return False
+        current_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        data = (cat_id, news_title, current_timestamp, news_description, news_image, 1, "", "", "Post", "", 0, current_timestamp)
+        with self._lock:
+            self._rows.append((data, on_commit, on_failure))
+            batch_full = len(self._rows) >= self.batch_size
+        if batch_full:
+            self.flush()
+        return True
+
+    def flush(self):
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return 0
+        try:
+            with metrics.timer('mysql_flush'):
+                self._write([data for data, _, _ in rows])
+        except Exception as err:
+            if not is_mysql_error(err):
+                raise
+            logging.error(f"Error inserting {len(rows)} news rows: {err}")
+            logging.error(traceback.format_exc())
+            if len(rows) == 1:
+                self._run_callbacks([(data, on_failure) for data, _, on_failure in rows], err)
+                return 0
+            return self._write_one_by_one(rows)
+        logging.info(f"Inserted {len(rows)} news rows")
+        metrics.increment('news_rows', len(rows))
+        self._run_callbacks([(data, on_commit) for data, on_commit, _ in rows])
+        return len(rows)
+
+    def _write_one_by_one(self, rows):
+        inserted = 0
+        for data, on_commit, on_failure in rows:
+            try:
+                self._insert([data])
+            except Exception as err:
+                if not is_mysql_error(err):
+                    raise
+                logging.error(f"Error inserting news row {data[1]!r}: {err}")
+                metrics.increment('news_rows_failed')
+                self._run_callbacks([(data, on_failure)], err)
+                continue
+            inserted += 1
+            self._run_callbacks([(data, on_commit)])
+        logging.info(f"Inserted {inserted} of {len(rows)} news rows one by one")
+        metrics.increment('news_rows', inserted)
+        return inserted
+
+    def _run_callbacks(self, callbacks, *args):
+        for data, callback in callbacks:
+            if callback:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    logging.error(f"Error in writer callback for {data[1]}: {e}")
+                    logging.error(traceback.format_exc())
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception(is_mysql_error), before_sleep=count_retry('insert_news'), reraise=True)
+    def _write(self, rows):
+        self._insert(rows)
+
+    def _insert(self, rows):
+        # Pooled connections are reset and reconnected by the pool on checkout
+        connection = self.pool.get_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.executemany(self.query, rows)
+                connection.commit()
+            except Exception as err:
+                if is_mysql_error(err):
+                    connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+
+def telegram_length(text):
+    # Telegram measures messages in UTF-16 code units, so emoji count twice
+    return len(text.encode('utf-16-le')) // 2
+
+def split_telegram_message(header, lines, footer, limit=TELEGRAM_MESSAGE_LIMIT):
+    """Packs newline-separated lines into as few messages as fit `limit`, in order.
+
+    The header starts the first message and the footer ends the last one.
+    """
+    messages = []
+    current = header
+    for line in lines + [footer]:
+        if current and telegram_length(f"{current}\n{line}") > limit:
+            messages.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+        while telegram_length(current) > limit:
+            # A single line longer than a message is cut rather than dropped
+            cut = limit
+            while telegram_length(current[:cut]) > limit:
+                cut -= 1
+            messages.append(current[:cut])
+            current = current[cut:]
+    if current:
+        messages.append(current)
+    return messages
+
+def build_digest_messages(article_titles):
+    current_date = datetime.now().strftime('%d %B %Y')
+    header = f"🌟 <b>{current_date} - Current Affairs in Gujarati</b> 🌟\n\nHere are the latest updates:\n"
+    lines = [f"{['📌', '🌟', '💡'][i % 3]} <b>{html.escape(title, quote=False)}</b>" for i, title in enumerate(article_titles, 1)]
+    footer = "\n📱 <b>Download our App</b>: [Link]\n📣 <b>Join Telegram</b>: [https://t.me/gujtest]"
+    return split_telegram_message(header, lines, footer)
+
+class TelegramSender:
+    """Posts the run's digest to the Telegram channel from a background thread.
+
+    Titles are HTML-escaped, long digests are split into several messages sent
+    in order over the shared HTTP session, and a 429 waits for the retry_after
+    the Bot API asks for. close() waits a bounded time so shutdown never hangs.
+    """
+
+    def __init__(self, config):
+        self.bot_token = config['bot_token']
+        self.channel = config['channel']
+        self.timeout = config['timeout']
+        self.max_attempts = config['max_attempts']
+        self._thread = None
+
+    def send_digest(self, article_titles):
+        if not self.bot_token or not self.channel:
+            logging.warning("Telegram bot token or channel not configured, skipping digest")
+            return
+        messages = build_digest_messages(article_titles)
+        logging.info(f"Sending Telegram digest with {len(article_titles)} titles in {len(messages)} messages")
+        self._thread = threading.Thread(target=self._deliver, args=(messages,), name='telegram-digest', daemon=True)
+        self._thread.start()
+
+    def _deliver(self, messages):
+        for index, text in enumerate(messages, 1):
+            if not self._send(text):
+                # Later parts would arrive out of order, so delivery stops at the first lost message
+                logging.error(f"Telegram digest stopped at message {index}/{len(messages)}")
+                return
+        logging.info("Telegram digest sent successfully")
+
+    def _redact(self, error):
+        return str(error).replace(self.bot_token, '<token>')
+
+    def _send(self, text):
+        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        payload = {'chat_id': self.channel, 'text': text, 'parse_mode': 'HTML', 'disable_web_page_preview': True}
+        for attempt in range(1, self.max_attempts + 1):
+            backoff = min(2 ** attempt, 60)
+            try:
+                with metrics.timer('telegram_send'):
+                    response = get_http_client().session.post(url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                logging.warning(f"Telegram request failed (attempt {attempt}/{self.max_attempts}): {self._redact(e)}")
+                time.sleep(backoff)
+                continue
+            if response.status_code == 200:
+                metrics.increment('telegram_messages', result='sent')
+                return True
+            if response.status_code == 429 or response.status_code >= 500:
+                try:
+                    retry_after = response.json().get('parameters', {}).get('retry_after')
+                except ValueError:
+                    retry_after = None
+                wait = retry_after if retry_after is not None else backoff
+                logging.warning(f"Telegram returned {response.status_code}, retrying in {wait}s")
+                metrics.increment('retries', operation='telegram_send')
+                time.sleep(wait)
+                continue
+            logging.error(f"Failed to send Telegram message: {response.text}")
+            break
+        metrics.increment('telegram_messages', result='failed')
+        return False
+
+    def close(self, timeout):
+        if self._thread is None:
+            return
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logging.warning(f"Telegram digest still sending after {timeout}s, leaving it to finish in the background")
+
+class FirebaseNotificationSender:
+    def __init__(self, topic=None):
+        self.fcm_notification_topic = topic or os.getenv('FCM_NOTIFICATION_TOPIC', 'android_news_app_topic')
+        logging.debug("Firebase sender initialized with topic: %s", self.fcm_notification_topic)
+
+    def build_message(self, title, message, image_url=None):
+        from firebase_admin import messaging
+        notification = messaging.Notification(title=title, body=message, image=image_url)
+        data = {"id": str(random.randint(1000, 9999)), "title": title, "message": message}
+        if image_url:
+            data["image"] = image_url
+        return messaging.Message(notification=notification, data=data, topic=self.fcm_notification_topic)
+
+    def send_batch(self, messages):
+        """Sends messages with one send_each call; returns the number delivered."""
+        from firebase_admin import messaging
+        try:
+            with metrics.timer('fcm_send'):
+                response = messaging.send_each(messages)
+            metrics.increment('notifications', response.success_count, result='sent')
+            metrics.increment('notifications', len(messages) - response.success_count, result='failed')
+            for result in response.responses:
+                if not result.success:
+                    logging.error(f"Failed to send Firebase notification: {result.exception}")
+            logging.info(f"Firebase notifications sent: {response.success_count}/{len(messages)}")
+            return response.success_count
+        except Exception as e:
+            logging.error(f"Failed to send Firebase notifications: {e}")
+            logging.error(traceback.format_exc())
+            return 0
+
+class NotificationQueue:
+    """Delivers article notifications from a background thread so the run never waits on FCM.
+
+    In 'each' mode notifications go out in send_each batches spaced at least
+    min_interval seconds apart, up to max_per_run per run. In 'digest' mode
+    a single aggregated notification is sent when the queue is closed.
+    """
+
+    def __init__(self, sender, mode, batch_size, min_interval, max_per_run):
+        self.sender = sender
+        self.mode = mode
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_per_run = max_per_run
+        self._queue = queue.Queue()
+        self._digest = []
+        self._queued = 0
+        self._last_sent = 0
+        self._thread = threading.Thread(target=self._run, name='notification-queue', daemon=True)
+        self._thread.start()
+
+    def enqueue(self, combined_title, paragraph, image_name):
+        if self.mode != 'digest' and self._queued >= self.max_per_run:
+            logging.warning(f"Notification limit of {self.max_per_run} reached, dropping: {combined_title[:50]}")
+            return
+        self._queued += 1
+        self._queue.put({
+            'title': combined_title[:100] if combined_title else "Current Affairs Update",
+            'message': paragraph[:200] if paragraph else "New update available.",
+            'image_url': f"{RENDER_CONFIG['asset_base_url']}{image_name}" if image_name else None
+        })
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            if self.mode == 'digest':
+                self._digest.extend(batch)
+                continue
+            self._send(batch)
+        if self._digest:
+            self._send([self._build_digest(self._digest)])
+
+    def _build_digest(self, items):
+        titles = "\n".join(f"• {item['title']}" for item in items[:5])
+        more = f"\n+{len(items) - 5} more" if len(items) > 5 else ""
+        image_url = next((item['image_url'] for item in items if item['image_url']), None)
+        return {'title': f"{len(items)} નવા કરંટ અફેર અપડેટ્સ", 'message': f"{titles}{more}"[:1000], 'image_url': image_url}
+
+    def _send(self, items):
+        wait = self._last_sent + self.min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        messages = [self.sender.build_message(item['title'], item['message'], item['image_url']) for item in items]
+        self.sender.send_batch(messages)
+        self._last_sent = time.monotonic()
+
+    def close(self, timeout):
+        """Stops accepting work and gives pending deliveries up to `timeout` seconds."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logging.warning(f"Notification delivery still running after {timeout}s, leaving it to finish in the background")
+
+class AhoCorasick:
+    """Multi-pattern matcher that reports every pattern occurrence in one pass over the text."""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for pattern, value in patterns:
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].append((pattern, value))
+        # Breadth-first, so every failure target is shallower and already complete
+        pending = list(self._goto[0].values())
+        for state in pending:
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter(self, text):
+        """Yields (end_index, pattern, value) for every match, end_index being exclusive."""
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern, value in self._output[state]:
+                yield index + 1, pattern, value
+
+def normalize_category_text(text):
+    return " ".join(text.lower().replace("&", " and ").split())
+
+class CategoryClassifier:
+    """Scores every category from gktoday tags, English text and translated text in a single automaton pass.
+
+    Tags weigh more than body text and full category names more than keywords;
+    the highest score wins, with ties going to the lower category id.
+    """
+
+    source_weights = {'tags': 5, 'english': 1, 'translated': 1}
+    pattern_weights = {'name': 3, 'keyword': 1}
+
+    def __init__(self, categories, default_id=DEFAULT_CATEGORY_ID):
+        self.default_id = default_id
+        patterns = {}
+        for cat_id, spec in categories.items():
+            for phrase in spec['gu'] + spec['en']:
+                patterns.setdefault(normalize_category_text(phrase), []).append((cat_id, 'name'))
+            for keyword in spec['keywords']:
+                patterns.setdefault(normalize_category_text(keyword), []).append((cat_id, 'keyword'))
+        self._automaton = AhoCorasick(patterns.items())
+
+    def classify(self, english_text, translated_text, tags=()):
+        segments = [
+            ('tags', normalize_category_text(" | ".join(tags))),
+            ('english', normalize_category_text(english_text)),
+            ('translated', normalize_category_text(translated_text))
+        ]
+        # NUL never occurs in a pattern, so no match can span two segments
+        text = "\0".join(segment for _, segment in segments)
+        boundaries = []
+        position = 0
+        for source, segment in segments:
+            position += len(segment)
+            boundaries.append((position, source))
+            position += 1
+        scores = {}
+        for end, pattern, matches in self._automaton.iter(text):
+            start = end - len(pattern)
+            # Latin patterns must match whole words ("award" should not match "awarded")
+            if pattern[0].isascii() and start > 0 and text[start - 1].isalnum():
+                continue
+            if pattern[-1].isascii() and end < len(text) and text[end].isalnum():
+                continue
+            source = next(source for boundary, source in boundaries if end <= boundary)
+            for cat_id, kind in matches:
+                scores[cat_id] = scores.get(cat_id, 0) + self.source_weights[source] * self.pattern_weights[kind]
+        if not scores:
+            return self.default_id
+        return min(scores, key=lambda cat_id: (-scores[cat_id], cat_id))
+
+category_classifier = CategoryClassifier(CATEGORIES)
+
+def article_texts(article):
+    return [article['heading'], article['first_paragraph']] + [block['text'] for block in article['blocks']]
+
+def build_content_list(article, translations):
+    translated_heading, first_paragraph_translated = translations[0], translations[1]
+    combined_heading = f"{article['heading']} - {translated_heading}"
+    logging.debug("Combined heading: %.50s...", combined_heading)
+    content_list = [{'type': 'heading', 'text': combined_heading}]
+    for block, translated_text in zip(article['blocks'], translations[2:]):
+        content_list.append({'type': block['type'], 'text': translated_text})
+    return {
+        'combined_heading': combined_heading,
+        'first_paragraph': first_paragraph_translated or "No introductory text available.",
+        'content_list': content_list
+    }
+
+QUIZ_QUESTION_PATTERN = re.compile(r'^\s*(?:Q(?:uestion)?\s*)?\d+\s*[.):]\s*')
+QUIZ_OPTION_PATTERN = re.compile(r'[\[(]([A-Da-d])[\])]\s*(.*?)(?=\s*[\[(][A-Da-d][\])]|\s*(?:Show\s+)?(?:Correct\s+)?Answer\b|$)', re.S)
+QUIZ_ANSWER_PATTERN = re.compile(r'(?:Correct\s+)?Answer\s*[:\-]\s*[\[(]?([A-Da-d])\b[\])]?\s*(.*)', re.I | re.S)
+# The answer letter is usually followed by the option text: "Correct Answer: A [Gujarat]"
+QUIZ_ANSWER_TEXT_PATTERN = re.compile(r'^\s*[\[(][^\])]*[\])]')
+QUIZ_NOTES_PATTERN = re.compile(r'^\s*(?:Notes?|Explanation)\s*[:\-]\s*', re.I)
+
+def truncate_text(text, limit):
+    """Collapses whitespace and cuts `text` to at most `limit` characters at a word boundary."""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 1].rsplit(' ', 1)[0] or text[:limit - 1]
+    return f"{cut}…"
+
+def extract_quiz(article):
+    """Pulls numbered questions, their [A]-[D] options, the correct answer and notes out of a quiz page's blocks."""
+    questions = []
+    for block in article['blocks']:
+        text = block['text']
+        if QUIZ_QUESTION_PATTERN.match(text):
+            body = QUIZ_QUESTION_PATTERN.sub('', text, count=1)
+            question = re.split(r'\s*[\[(][A-Da-d][\])]|\s*(?:Show\s+)?(?:Correct\s+)?Answer\b', body, maxsplit=1)[0]
+            questions.append({'question': question.strip(), 'options': [], 'answer': None, 'notes': None})
+            text = body[len(question):]
+        if not questions:
+            continue
+        current = questions[-1]
+        for key, option in QUIZ_OPTION_PATTERN.findall(text):
+            if option.strip():
+                current['options'].append({'key': key.upper(), 'text': option.strip()})
+        if match := QUIZ_ANSWER_PATTERN.search(text):
+            current['answer'] = match.group(1).upper()
+            text = QUIZ_ANSWER_TEXT_PATTERN.sub('', match.group(2), count=1)
+        if QUIZ_NOTES_PATTERN.match(text):
+            current['notes'] = QUIZ_NOTES_PATTERN.sub('', text, count=1).strip() or None
+    return [question for question in questions if question['question'] and question['options']]
+
+def summary_content_hash(article):
+    # Keyed on the English source so a stored summary can be found before anything is translated
+    content = json.dumps([article['heading'], article['first_paragraph'], article['blocks']], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+def build_summary(translated, config):
+    """Plain-text snippet and key facts taken from an article's translated content."""
+    paragraphs = [item['text'] for item in translated['content_list'] if item['type'] == 'paragraph' and item['text'].strip()]
+    key_facts = [" ".join(item['text'].split()) for item in translated['content_list'] if item['type'] == 'list_item' and item['text'].strip()]
+    return {
+        'snippet': truncate_text(paragraphs[0] if paragraphs else translated['first_paragraph'], config['snippet_chars']),
+        'key_facts': key_facts[:config['max_key_facts']],
+        'quiz': []
+    }
+
+def quiz_texts(quiz):
+    texts = []
+    for question in quiz:
+        texts.append(question['question'])
+        texts.extend(option['text'] for option in question['options'])
+        texts.append(question['notes'] or "")
+    return texts
+
+def apply_quiz_translations(quiz, translations):
+    position = 0
+    translated_quiz = []
+    for question in quiz:
+        options = question['options']
+        translated_quiz.append({
+            'question': translations[position],
+            'options': [dict(option, text=text) for option, text in zip(options, translations[position + 1:position + 1 + len(options)])],
+            'answer': question['answer'],
+            'notes': translations[position + 1 + len(options)] or None
+        })
+        position += len(options) + 2
+    return translated_quiz
+
+class SummaryStore:
+    """Sidecar MongoDB collection of precomputed article fields, memoized by content hash.
+
+    Consumers look rows up by news_title, which matches tbl_news.news_title,
+    and read the snippet, key facts and quiz instead of parsing the stored HTML.
+    Quiz pages have no tbl_news row; their summary is the only record of them.
+    """
+
+    def __init__(self, get_collection):
+        self.get_collection = get_collection
+        self._collection = None
+        self._lock = threading.Lock()
+
+    @property
+    def collection(self):
+        with self._lock:
+            if self._collection is None:
+                self._collection = self.get_collection()
+                self._collection.create_index('content_hash', unique=True)
+                self._collection.create_index('news_title')
+            return self._collection
+
+    def get(self, content_hash):
+        try:
+            document = self.collection.find_one({'content_hash': content_hash}, {'snippet': 1, 'key_facts': 1, 'quiz': 1, '_id': 0})
+            return document
+        except Exception as e:
+            logging.error(f"Error looking up article summary in MongoDB: {e}")
+            return None
+
+    def save(self, content_hash, summary, news_title, url):
+        try:
+            self.collection.update_one(
+                {'content_hash': content_hash},
+                {'$setOnInsert': dict(summary, news_title=news_title, created_at=datetime.utcnow()),
+                 '$addToSet': {'urls': url}},
+                upsert=True
+            )
+        except Exception as e:
+            logging.error(f"Error saving article summary to MongoDB: {e}")
+
+PIPELINE_STAGES = ['fetch', 'parse', 'translate', 'precompute', 'image', 'persist', 'notify']
+
+class SkipArticle(Exception):
+    """Raised by a stage when an article can never be processed, so it is not retried.
+
+    `fields` are stored with the URL's scraped record.
+    """
+
+    def __init__(self, message, fields=None):
+        super().__init__(message)
+        self.fields = fields or {}
+
+class JobQueue:
+    """Durable SQLite queue that checkpoints each article's progress through the pipeline stages.
+
+    A job holds the output of its last completed stage. Jobs interrupted by a
+    crash are picked up again at the stage they stopped at, and failed jobs
+    once their retry delay has passed, so a short outage of a downstream
+    service costs a job one or two attempts however often the queue is polled.
+    """
+
+    def __init__(self, path, max_attempts, retry_delay, max_retry_delay):
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "url TEXT PRIMARY KEY, stage TEXT NOT NULL, status TEXT NOT NULL, payload TEXT NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, error TEXT, updated_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_jobs_stage_status ON jobs (stage, status)")
+        self._connection.commit()
+        self.resume()
+
+    def resume(self):
+        """Makes jobs left running by a crashed run and failed jobs whose retry delay has passed pending again.
+
+        Called when the queue is opened and, in daemon mode, before every
+        cycle; no pipeline may be running at the time.
+        """
+        now = time.time()
+        with self._lock:
+            retries = self._connection.execute("SELECT url, attempts, updated_at FROM jobs WHERE status = 'retry'").fetchall()
+            # Deferred jobs keep their attempt count, so they wait at least the base delay
+            due = [(url,) for url, attempts, updated_at in retries
+                   if updated_at + min(self.retry_delay * 4 ** (max(attempts, 1) - 1), self.max_retry_delay) <= now]
+            self._connection.executemany("UPDATE jobs SET status = 'pending' WHERE url = ?", due)
+            resumed = len(due) + self._connection.execute(
+                "UPDATE jobs SET status = 'pending' WHERE status = 'running'"
+            ).rowcount
+            self._connection.commit()
+        if resumed:
+            logging.info(f"Resuming {resumed} unfinished pipeline jobs")
+        return resumed
+
+    def enqueue(self, urls):
+        """Adds a job for each URL that has none yet; returns the number of jobs added."""
+        with self._lock:
+            added = self._connection.executemany(
+                "INSERT OR IGNORE INTO jobs (url, stage, status, payload, updated_at) VALUES (?, ?, 'pending', '{}', ?)",
+                [(url, PIPELINE_STAGES[0], time.time()) for url in urls]
+            ).rowcount
+            self._connection.commit()
+        return added
+
+    def claim(self, stage):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, payload FROM jobs WHERE stage = ? AND status = 'pending' ORDER BY updated_at LIMIT 1",
+                (stage,)
+            ).fetchone()
+            if not row:
+                return None
+            self._connection.execute("UPDATE jobs SET status = 'running' WHERE url = ?", (row[0],))
+            self._connection.commit()
+        return row[0], json.loads(row[1])
+
+    def advance(self, url, payload):
+        with self._lock:
+            (stage,) = self._connection.execute("SELECT stage FROM jobs WHERE url = ?", (url,)).fetchone()
+            index = PIPELINE_STAGES.index(stage) + 1
+            next_stage, status = (PIPELINE_STAGES[index], 'pending') if index < len(PIPELINE_STAGES) else (stage, 'done')
+            self._connection.execute(
+                "UPDATE jobs SET stage = ?, status = ?, payload = ?, attempts = 0, error = NULL, updated_at = ? WHERE url = ?",
+                (next_stage, status, json.dumps(payload), time.time(), url)
+            )
+            self._connection.commit()
+
+    def finish(self, url):
+        """Marks a job done without running its remaining stages."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET stage = ?, status = 'done', payload = '{}', attempts = 0, error = NULL, updated_at = ? WHERE url = ?",
+                (PIPELINE_STAGES[-1], time.time(), url)
+            )
+            self._connection.commit()
+
+    def fail(self, url, error, permanent=False):
+        """Records a failed attempt; returns True when the job has failed for good."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET attempts = attempts + 1, error = ?, updated_at = ?, "
+                "status = CASE WHEN ? OR attempts + 1 >= ? THEN 'failed' ELSE 'retry' END WHERE url = ?",
+                (str(error)[:1000], time.time(), permanent, self.max_attempts, url)
+            )
+            self._connection.commit()
+            row = self._connection.execute("SELECT status FROM jobs WHERE url = ?", (url,)).fetchone()
+        return row is not None and row[0] == 'failed'
+
+    def defer(self, url, error):
+        """Parks a job until the next run without using up one of its attempts."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = 'retry', error = ?, updated_at = ? WHERE url = ?",
+                (str(error)[:1000], time.time(), url)
+            )
+            self._connection.commit()
+
+    def has_active(self, stages, include_pending_in=None):
+        """True while any of `stages` has pending or running jobs, or `include_pending_in` has pending ones."""
+        with self._lock:
+            placeholders = ','.join('?' * len(stages))
+            count = self._connection.execute(
+                f"SELECT COUNT(*) FROM jobs WHERE (stage IN ({placeholders}) AND status IN ('pending', 'running')) "
+                "OR (stage = ? AND status = 'pending')",
+                list(stages) + [include_pending_in]
+            ).fetchone()[0]
+        return count > 0
+
+    def summary(self):
+        with self._lock:
+            rows = self._connection.execute("SELECT stage, status, COUNT(*) FROM jobs GROUP BY stage, status").fetchall()
+        return {f"{stage}/{status}": count for stage, status, count in rows}
+
+    def done_urls(self):
+        with self._lock:
+            return [row[0] for row in self._connection.execute("SELECT url FROM jobs WHERE status = 'done'")]
+
+    def purge_done(self, urls):
+        with self._lock:
+            self._connection.executemany("DELETE FROM jobs WHERE url = ? AND status = 'done'", [(url,) for url in urls])
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+class ArticlePipeline:
+    """Runs articles through the pipeline stages, each with its own pool of async workers.
+
+    Every stage method takes the job payload left by the previous stage and
+    returns the payload to checkpoint. The persist stage hands rows to the
+    NewsWriter and advances jobs from its commit callback instead.
+    """
+
+    def __init__(self, job_queue, workers, poll_interval, news_writer, url_store, duplicate_index, rate_limiter,
+                 translation_batcher, summary_store, ftp_pool, image_index, renderer, notification_queue):
+        self.job_queue = job_queue
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.news_writer = news_writer
+        self.url_store = url_store
+        self.duplicate_index = duplicate_index
+        self.rate_limiter = rate_limiter
+        self.translation_batcher = translation_batcher
+        self.summary_store = summary_store
+        self.ftp_pool = ftp_pool
+        self.image_index = image_index
+        self.renderer = renderer
+        self.notification_queue = notification_queue
+        self.article_titles = []
+        self._running_workers = {}
+        self._started = {}
+
+    async def fetch_stage(self, url, payload):
+        logging.info(f"Processing article: {url}")
+        if source_for_url(url) is None:
+            raise SkipArticle("No registered source for this host")
+        # Article pages do not change once published, so a cached copy is reused as is
+        if not get_http_client().has_cached(url):
+            await self.rate_limiter.wait(url)
+        response = await asyncio.to_thread(get_http_client().get_page, url, True)
+        return {'html': response.text}
+
+    async def parse_stage(self, url, payload):
+        article = await asyncio.to_thread(source_for_url(url).parse_article, payload['html'])
+        if not article:
+            raise SkipArticle("No article content found")
+        # Republished copies are dropped here, before translation, image upload and notification
+        fingerprint = article_fingerprint(article, DEDUP_CONFIG['simhash_min_words'])
+        if fingerprint is not None:
+            duplicate_of = await asyncio.to_thread(self.duplicate_index.check_and_claim, url, fingerprint)
+            if duplicate_of:
+                metrics.increment('near_duplicates')
+                raise SkipArticle(f"Near-duplicate of {duplicate_of}", {'duplicate_of': duplicate_of})
+        return {'article': article, 'fingerprint': f"{fingerprint:016x}" if fingerprint is not None else None}
+
+    async def translate_stage(self, url, payload):
+        article = payload['article']
+        if source_for_url(url).is_quiz_url(url):
+            # A quiz page seen before, under this or another URL, needs no extraction or translation
+            summary = await asyncio.to_thread(self.summary_store.get, summary_content_hash(article))
+            if summary is not None:
+                metrics.increment('summaries', result='memoized')
+                return dict(payload, summary=summary)
+            # Quiz pages are not published, so only the heading, the intro and the extracted Q&A are translated
+            quiz = extract_quiz(article)
+            if not quiz:
+                raise SkipArticle("No quiz questions found")
+            translations = await self._translate_with_pause([article['heading'], article['first_paragraph']] + quiz_texts(quiz))
+            return dict(payload, translated=build_content_list(dict(article, blocks=[]), translations[:2]),
+                        quiz=apply_quiz_translations(quiz, translations[2:]))
+        translations = await self._translate_with_pause(article_texts(article))
+        return dict(payload, translated=build_content_list(article, translations))
+
+    async def _translate_with_pause(self, texts):
+        deadline = time.monotonic() + TRANSLATION_CONFIG['max_pause']
+        while True:
+            try:
+                return await self.translation_batcher.translate(texts)
+            except TranslationUnavailable as e:
+                # Waiting out the backend beats storing a half-English article; past the deadline the job is deferred
+                if time.monotonic() + e.retry_after > deadline:
+                    raise
+                logging.warning(f"Translation paused for {e.retry_after:.1f}s: {e}")
+                with metrics.timer('translate_pause'):
+                    await asyncio.sleep(e.retry_after)
+
+    async def precompute_stage(self, url, payload):
+        is_quiz = source_for_url(url).is_quiz_url(url)
+        summary = payload.get('summary')
+        if summary is None:
+            translated = payload['translated']
+            summary = build_summary(translated, SUMMARY_CONFIG)
+            if is_quiz:
+                summary['quiz'] = payload.get('quiz', [])
+                logging.info(f"Extracted {len(summary['quiz'])} quiz questions from {url}")
+            await asyncio.to_thread(
+                self.summary_store.save, summary_content_hash(payload['article']), summary, translated['combined_heading'], url
+            )
+            metrics.increment('summaries', result='computed')
+        if is_quiz:
+            # Quiz pages only feed the summary sidecar and are never published as news
+            await asyncio.to_thread(self.url_store.record, url, {'quiz': True})
+            await asyncio.to_thread(self.job_queue.finish, url)
+            self._started.pop(url, None)
+            metrics.increment('quizzes')
+            return None
+        return dict(payload, summary=summary)
+
+    async def image_stage(self, url, payload):
+        image_url = payload['article']['image_url']
+        image_filename = None
+        if image_url:
+            await self.rate_limiter.wait(image_url)
+            image_filename = await asyncio.to_thread(download_and_process_image, image_url, self.ftp_pool, self.image_index)
+        return dict(payload, image_filename=image_filename)
+
+    async def persist_stage(self, url, payload):
+        article = payload['article']
+        translated = payload['translated']
+        content_list = translated['content_list']
+        news_description = " ".join(item['text'] for item in content_list if item['type'] == 'paragraph')
+        english_text = " ".join([article['heading']] + [block['text'] for block in article['blocks']])
+        cat_id = category_classifier.classify(english_text, news_description, article['categories'])
+        formatted_html = format_content_as_html(content_list, self.renderer)
+        if not formatted_html:
+            raise SkipArticle("Failed to format HTML content")
+
+        fingerprint = payload.get('fingerprint')
+
+        def on_commit():
+            # Log URL to MongoDB after successful processing, with the fingerprint for near-duplicate lookups
+            # and the stored title so maintenance jobs can find the source of a tbl_news row
+            fields = self.duplicate_index.fields(int(fingerprint, 16) if fingerprint else None)
+            self.url_store.record(url, dict(fields, news_title=translated['combined_heading']))
+            self.job_queue.advance(url, payload)
+
+        def on_failure(error):
+            self.fail_job(url, error)
+
+        queued = await asyncio.to_thread(
+            self.news_writer.add, cat_id, translated['combined_heading'], formatted_html,
+            payload['image_filename'], on_commit, on_failure
+        )
+        if not queued:
+            raise SkipArticle("News row was rejected by the writer")
+        return None
+
+    async def notify_stage(self, url, payload):
+        translated = payload['translated']
+        # Jobs checkpointed before the precompute stage existed carry no summary
+        snippet = payload.get('summary', {}).get('snippet') or translated['first_paragraph']
+        self.notification_queue.enqueue(translated['combined_heading'], snippet, payload['image_filename'])
+        self.article_titles.append(translated['combined_heading'])
+        return {}
+
+    def fail_job(self, url, error, permanent=False, fields=None):
+        # URLs that failed for good are recorded too, so later listing crawls treat them as known
+        if self.job_queue.fail(url, error, permanent):
+            self.duplicate_index.release(url)
+            self.url_store.record(url, dict(fields or {}, failed=str(error)[:200]))
+
+    async def _on_stage_complete(self, stage):
+        if stage == 'persist':
+            await asyncio.to_thread(self.news_writer.flush)
+
+    async def _worker(self, stage):
+        handler = getattr(self, f"{stage}_stage")
+        upstream = PIPELINE_STAGES[:PIPELINE_STAGES.index(stage)]
+        try:
+            while True:
+                job = await asyncio.to_thread(self.job_queue.claim, stage)
+                if job is None:
+                    if upstream and await asyncio.to_thread(self.job_queue.has_active, upstream, stage):
+                        await asyncio.sleep(self.poll_interval)
+                        continue
+                    return
+                url, payload = job
+                self._started.setdefault(url, time.perf_counter())
+                try:
+                    with metrics.timer('stage', stage=stage):
+                        result = await handler(url, payload)
+                    if result is not None:
+                        await asyncio.to_thread(self.job_queue.advance, url, result)
+                    metrics.increment('jobs', stage=stage, result='ok')
+                    if stage == PIPELINE_STAGES[-1]:
+                        metrics.observe('article', time.perf_counter() - self._started.pop(url))
+                except SkipArticle as e:
+                    logging.error(f"Skipping article {url}: {e}")
+                    metrics.increment('jobs', stage=stage, result='skipped')
+                    await asyncio.to_thread(self.fail_job, url, e, True, e.fields)
+                except TranslationUnavailable as e:
+                    logging.warning(f"Deferring {url} to the next run: {e}")
+                    metrics.increment('jobs', stage=stage, result='deferred')
+                    await asyncio.to_thread(self.job_queue.defer, url, e)
+                except Exception as e:
+                    logging.error(f"Error in {stage} stage for {url}: {e}")
+                    logging.error(traceback.format_exc())
+                    metrics.increment('jobs', stage=stage, result='failed')
+                    await asyncio.to_thread(self.fail_job, url, e)
+        finally:
+            self._running_workers[stage] -= 1
+            if self._running_workers[stage] == 0:
+                await self._on_stage_complete(stage)
+
+    async def run(self):
+        tasks = []
+        for stage in PIPELINE_STAGES:
+            self._running_workers[stage] = self.workers[stage]
+            tasks.extend(self._worker(stage) for _ in range(self.workers[stage]))
+        await asyncio.gather(*tasks)
+        logging.info(f"Pipeline finished: {self.job_queue.summary()}")
+        return self.article_titles
+
+RENDERED_BLOCK_TYPES = {'news-title': 'heading', 'news-paragraph': 'paragraph', 'news-list-item': 'list_item'}
+
+def parse_rendered_content(news_description):
+    """Recovers the content list from a stored news_description rendered by NewsRenderer."""
+    soup = parse_html(news_description, SoupStrainer(class_=has_any_class(RENDERED_BLOCK_TYPES)))
+    content_list = []
+    for tag in soup.find_all(class_=has_any_class(RENDERED_BLOCK_TYPES)):
+        block_type = next(RENDERED_BLOCK_TYPES[name] for name in tag['class'] if name in RENDERED_BLOCK_TYPES)
+        content_list.append({'type': block_type, 'text': tag.get_text().strip()})
+    return content_list
+
+def load_rerender_checkpoint(path, parts):
+    try:
+        with open(path) as file:
+            checkpoint = json.load(file)
+    except FileNotFoundError:
+        return 0
+    if checkpoint.get('parts') != parts:
+        logging.info(f"Checkpoint at {path} is for parts {checkpoint.get('parts')}, starting from the first row")
+        return 0
+    return checkpoint['last_id']
+
+def save_rerender_checkpoint(path, parts, last_id):
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.tmp", 'w') as file:
+        json.dump({'parts': parts, 'last_id': last_id, 'updated_at': datetime.utcnow().isoformat() + 'Z'}, file)
+    os.replace(f"{path}.tmp", path)
+
+class NewsRerenderer:
+    """Re-derives existing tbl_news rows in keyset batches and writes back only the rows that changed.
+
+    'html' re-renders the stored content with the current template, without
+    any network access. 'translation' needs the English source: the article
+    URL is found by title in scraped_urls and the page comes from the HTTP
+    cache when it is there, with translations from the translation cache.
+    Rows whose source cannot be found, or whose text the backend rejects,
+    keep their text. 'category' uses the source when there is one and
+    otherwise the stored Gujarati paragraphs and the English half of the title.
+    """
+
+    def __init__(self, pool, parts, renderer, rate_limiter, config):
+        self.pool = pool
+        self.parts = parts
+        self.renderer = renderer
+        self.rate_limiter = rate_limiter
+        self.config = config
+        id_column = config['id_column']
+        self.select_query = (
+            f"SELECT {id_column}, cat_id, news_title, news_description FROM tbl_news "
+            f"WHERE {id_column} > %s ORDER BY {id_column} LIMIT %s"
+        )
+        self.update_query = f"UPDATE tbl_news SET cat_id = %s, news_title = %s, news_description = %s WHERE {id_column} = %s"
+
+    def read_batch(self, after_id):
+        connection = self.pool.get_connection()
+        try:
+            # Unbuffered, so rows stream from the server instead of being copied into one result set first
+            cursor = connection.cursor(buffered=False)
+            try:
+                cursor.execute(self.select_query, (after_id, self.config['batch_size']))
+                return [row for row in cursor]
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), retry=retry_if_exception(is_mysql_error), before_sleep=count_retry('rerender_news'))
+    def write_batch(self, updates):
+        connection = self.pool.get_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.executemany(self.update_query, updates)
+                connection.commit()
+            except Exception as err:
+                if is_mysql_error(err):
+                    connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+
+    async def load_sources(self, rows):
+        """Returns {news_title: (url, article)} for the rows whose source page can be found and parsed."""
+        if not {'category', 'translation'} & set(self.parts):
+            return {}
+        titles = [row[2] for row in rows]
+        collection = get_mongo_collection(MONGO_COLLECTION)
+        documents = await asyncio.to_thread(
+            lambda: list(collection.find({'news_title': {'$in': titles}}, {'url': 1, 'news_title': 1, '_id': 0}))
+        )
+        sources = {}
+        for document in documents:
+            url = document['url']
+            source = source_for_url(url)
+            if source is None:
+                continue
+            try:
+                if not get_http_client().has_cached(url):
+                    await self.rate_limiter.wait(url)
+                response = await asyncio.to_thread(get_http_client().get_page, url, True)
+                article = await asyncio.to_thread(source.parse_article, response.content)
+            except requests.RequestException as e:
+                logging.warning(f"Could not fetch source of '{document['news_title'][:50]}': {e}")
+                continue
+            if article:
+                sources[document['news_title']] = (url, article)
+        return sources
+
+    def rederive(self, row, source, translations):
+        row_id, cat_id, news_title, news_description = row
+        content_list = parse_rendered_content(news_description)
+        if not content_list:
+            logging.warning(f"Row {row_id} has no rendered content blocks, leaving it unchanged")
+            return None
+        article = source[1] if source else None
+        content_changed = False
+        if 'translation' in self.parts and article and translations:
+            translated = build_content_list(article, translations)
+            news_title = translated['combined_heading']
+            content_changed = translated['content_list'] != content_list
+            content_list = translated['content_list']
+        if 'category' in self.parts:
+            translated_text = " ".join(item['text'] for item in content_list if item['type'] == 'paragraph')
+            if article:
+                english_text = " ".join([article['heading']] + [block['text'] for block in article['blocks']])
+                tags = article['categories']
+            else:
+                # Without a cached source the English half of the stored "English - Gujarati" title is all that is left
+                english_text = news_title.split(' - ', 1)[0]
+                tags = ()
+            cat_id = category_classifier.classify(english_text, translated_text, tags)
+        if 'html' in self.parts or content_changed or news_title != row[2]:
+            news_description = format_content_as_html(content_list, self.renderer) or row[3]
+        if (cat_id, news_title, news_description) == row[1:]:
+            return None
+        return (cat_id, news_title, news_description, row_id)
+
+    async def run(self, restart=False):
+        path = self.config['checkpoint_path']
+        last_id = 0 if restart else load_rerender_checkpoint(path, self.parts)
+        logging.info(f"Re-deriving {', '.join(self.parts)} for tbl_news rows after id {last_id}")
+        while True:
+            with metrics.timer('rerender_batch'):
+                rows = await asyncio.to_thread(self.read_batch, last_id)
+                if not rows:
+                    break
+                sources = await self.load_sources(rows)
+                translations = {}
+                if 'translation' in self.parts and sources:
+                    translations = await self.translate_sources(sources)
+                updates = [
+                    update for row in rows
+                    if (update := self.rederive(row, sources.get(row[2]), translations.get(row[2]))) is not None
+                ]
+                if updates:
+                    await asyncio.to_thread(self.write_batch, updates)
+                    await asyncio.to_thread(self.update_source_titles, updates, rows, sources)
+                last_id = rows[-1][0]
+                save_rerender_checkpoint(path, self.parts, last_id)
+            metrics.increment('rerender_rows', len(rows), result='read')
+            metrics.increment('rerender_rows', len(updates), result='updated')
+            logging.info(f"Updated {len(updates)} of {len(rows)} rows up to id {last_id}")
+            await asyncio.sleep(self.config['batch_delay'])
+        logging.info("Re-render finished")
+
+    async def translate_sources(self, sources):
+        texts = {title: article_texts(article) for title, (_, article) in sources.items()}
+        try:
+            translated = await asyncio.to_thread(translate_texts, [text for group in texts.values() for text in group])
+        except TranslationInputError:
+            # The accepted texts are cached by now; rows with a rejected text keep their stored translation
+            translations = {}
+            for title, group in texts.items():
+                try:
+                    translations[title] = await asyncio.to_thread(translate_texts, group)
+                except TranslationInputError as e:
+                    logging.warning(f"Keeping the stored translation of {title!r}: {e}")
+                    metrics.increment('rerender_rows', result='rejected')
+            return translations
+        translations = {}
+        position = 0
+        for title, group in texts.items():
+            translations[title] = translated[position:position + len(group)]
+            position += len(group)
+        return translations
+
+    def update_source_titles(self, updates, rows, sources):
+        from pymongo import UpdateOne
+        old_titles = {row[0]: row[2] for row in rows}
+        changes = [
+            UpdateOne({'url': sources[old_titles[row_id]][0]}, {'$set': {'news_title': news_title}})
+            for _, news_title, _, row_id in updates
+            if news_title != old_titles[row_id] and old_titles[row_id] in sources
+        ]
+        if changes:
+            get_mongo_collection(MONGO_COLLECTION).bulk_write(changes, ordered=False)
+
+async def rerender_news(parts, restart=False):
+    ftp_pool = None
+    try:
+        db_pool = create_db_pool()
+        if not db_pool:
+            raise Exception("Failed to establish initial database connection")
+        stylesheet_url = None
+        if RENDER_CONFIG['stylesheet'] == 'external':
+            ftp_pool = FtpPool(FTP_CONFIG)
+            stylesheet_url = await asyncio.to_thread(publish_stylesheet, ftp_pool)
+        rerenderer = NewsRerenderer(
+            db_pool,
+            parts,
+            NewsRenderer(stylesheet_url),
+            HostRateLimiter(SCRAPER_CONFIG['host_delay']),
+            RERENDER_CONFIG
+        )
+        await rerenderer.run(restart)
+    except Exception as e:
+        logging.error(f"Re-render error: {e}")
+        logging.error(traceback.format_exc())
+        raise
+    finally:
+        if ftp_pool:
+            ftp_pool.close()
+        close_translation_cache()
+        close_http_client()
+        write_metrics_report()
+        close_mongo_client()
+
+class ScraperService:
+    """Scraper state that outlives a single crawl: stores, pools and caches are kept between cycles.
+
+    Clients needed only to process articles (Firebase, MySQL, FTP and the
+    image and summary stores) are created the first time a cycle has work,
+    so cycles that find nothing new never touch them.
+    """
+
+    def __init__(self):
+        self.sources = enabled_sources()
+        self.url_store = ScrapedUrlStore(
+            lambda: get_mongo_collection(MONGO_COLLECTION),
+            DEDUP_CONFIG['bloom_path'],
+            DEDUP_CONFIG['bloom_capacity'],
+            DEDUP_CONFIG['bloom_error_rate'],
+            DEDUP_CONFIG['flush_size']
+        )
+        self.job_queue = JobQueue(
+            PIPELINE_CONFIG['queue_path'],
+            PIPELINE_CONFIG['max_attempts'],
+            PIPELINE_CONFIG['retry_delay'],
+            PIPELINE_CONFIG['max_retry_delay']
+        )
+        self.rate_limiter = HostRateLimiter(SCRAPER_CONFIG['host_delay'])
+        self.listing_rate_limiter = HostRateLimiter(SCRAPER_CONFIG['listing_delay'])
+        self.news_writer = None
+        self.ftp_pool = None
+        self.image_index = None
+        self.renderer = None
+
+    async def _start_pipeline_clients(self):
+        if self.news_writer:
+            return
+        initialize_firebase()
+        db_pool = create_db_pool()
+        if not db_pool:
+            raise Exception("Failed to establish initial database connection")
+        self.news_writer = NewsWriter(db_pool, DB_CONFIG['batch_size'])
+        self.image_index = ImageIndex(get_mongo_collection(MONGO_IMAGE_COLLECTION))
+        self.ftp_pool = FtpPool(FTP_CONFIG)
+        stylesheet_url = None
+        if RENDER_CONFIG['stylesheet'] == 'external':
+            stylesheet_url = await asyncio.to_thread(publish_stylesheet, self.ftp_pool)
+        self.renderer = NewsRenderer(stylesheet_url)
+
+    async def run_cycle(self, pages, backfill=False):
+        """Crawls the listings and runs new and unfinished articles through the pipeline; returns the number of jobs added."""
+        article_urls = await fetch_new_article_urls(
+            self.sources, pages, self.url_store, self.listing_rate_limiter, SCRAPER_CONFIG['listing_concurrency'], backfill
+        )
+        self.job_queue.resume()
+        added = self.job_queue.enqueue(article_urls)
+        logging.info(f"Queued {added} new articles, pipeline state: {self.job_queue.summary()}")
+        # Most cycles find nothing new; they end here without connecting to any other service
+        if not self.job_queue.has_active(PIPELINE_STAGES):
+            logging.info("No new or unfinished articles")
+            self.purge_done_jobs()
+            return 0
+
+        await self._start_pipeline_clients()
+        notification_queue = NotificationQueue(
+            FirebaseNotificationSender(),
+            NOTIFICATION_CONFIG['mode'],
+            NOTIFICATION_CONFIG['batch_size'],
+            NOTIFICATION_CONFIG['min_interval'],
+            NOTIFICATION_CONFIG['max_per_run']
+        )
+        telegram_sender = TelegramSender(TELEGRAM_CONFIG)
+        try:
+            pipeline = ArticlePipeline(
+                self.job_queue,
+                PIPELINE_CONFIG['workers'],
+                PIPELINE_CONFIG['poll_interval'],
+                self.news_writer,
+                self.url_store,
+                NearDuplicateIndex(lambda: get_mongo_collection(MONGO_COLLECTION), DEDUP_CONFIG['simhash_max_distance']),
+                self.rate_limiter,
+                TranslationBatcher(TRANSLATION_CONFIG['batch_window']),
+                SummaryStore(lambda: get_mongo_collection(MONGO_SUMMARY_COLLECTION)),
+                self.ftp_pool,
+                self.image_index,
+                self.renderer,
+                notification_queue
+            )
+            article_titles = await pipeline.run()
+            if article_titles:
+                telegram_sender.send_digest(article_titles)
+            else:
+                logging.warning("No article titles to send in Telegram message")
+        finally:
+            # Rows queued before a failure are still written and their URLs recorded
+            self.news_writer.flush()
+            notification_queue.close(NOTIFICATION_CONFIG['close_timeout'])
+            telegram_sender.close(TELEGRAM_CONFIG['close_timeout'])
+            self.url_store.checkpoint()
+        self.purge_done_jobs()
+        return added
+
+    def purge_done_jobs(self):
+        """Drops finished jobs once their URLs are confirmed stored in MongoDB.
+
+        A failed flush in an earlier run can leave done jobs whose URLs were
+        never recorded; those are recorded now, and nothing is purged unless
+        the checkpoint succeeds.
+        """
+        done_urls = self.job_queue.done_urls()
+        if not done_urls:
+            return
+        missing = self.url_store.filter_new(done_urls)
+        if missing:
+            logging.warning(f"Recording {len(missing)} finished URLs missing from MongoDB")
+            for url in missing:
+                self.url_store.record(url)
+        self.url_store.checkpoint()
+        self.job_queue.purge_done(done_urls)
+
+    def trim_caches(self):
+        """Applies the translation cache limits and prunes expired HTTP cache files."""
+        if translation_cache is not None:
+            translation_cache.evict()
+        if http_client is not None:
+            removed = http_client.prune(HTTP_CONFIG['cache_max_age_days'] * 86400)
+            if removed:
+                logging.info(f"Pruned {removed} expired HTTP cache files")
+
+    def close(self):
+        if self.news_writer:
+            self.news_writer.flush()
+        if self.ftp_pool:
+            self.ftp_pool.close()
+        close_translation_cache()
+        close_http_client()
+        self.url_store.close()
+        self.job_queue.close()
+        close_mongo_client()
+
+async def main(pages=SCRAPER_CONFIG['pages'], backfill=False):
+    service = None
+    try:
+        logging.info("Starting news scraper")
+        service = ScraperService()
+        await service.run_cycle(pages, backfill)
+    except Exception as e:
+        logging.error(f"Main execution error: {e}")
+        logging.error(traceback.format_exc())
+        raise
+    finally:
+        if service:
+            service.close()
+        write_metrics_report()
+
+class HealthServer:
+    """Serves /healthz, /metrics (Prometheus text) and /metrics.json from a background thread."""
+
+    def __init__(self, host, port, status):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/healthz':
+                    healthy, details = status()
+                    self._reply(200 if healthy else 503, 'application/json', json.dumps(details))
+                elif self.path == '/metrics':
+                    self._reply(200, 'text/plain; version=0.0.4', metrics.prometheus_text())
+                elif self.path == '/metrics.json':
+                    self._reply(200, 'application/json', json.dumps(metrics.snapshot()))
+                else:
+                    self._reply(404, 'text/plain', "Not found\n")
+
+            def _reply(self, code, content_type, body):
+                data = body.encode()
+                self.send_response(code)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                logging.debug("Health server: " + format, *args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='health-server', daemon=True)
+        self._thread.start()
+        logging.info(f"Health and metrics endpoint listening on {host}:{self._server.server_address[1]}")
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+async def run_daemon(pages=SCRAPER_CONFIG['pages']):
+    """Polls the listings until SIGTERM/SIGINT, keeping clients warm between cycles.
+
+    The interval drops to min_interval whenever a cycle finds new articles and
+    grows by `backoff` after every quiet or failed cycle, up to max_interval.
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    daemon_task = asyncio.current_task()
+    state = {'started_at': time.time(), 'last_cycle_at': None, 'last_success_at': None,
+             'consecutive_failures': 0, 'interval': DAEMON_CONFIG['min_interval'], 'cycles': 0}
+
+    def request_stop(signum):
+        if stop.is_set():
+            logging.warning("Second shutdown signal, cancelling the current cycle")
+            daemon_task.cancel()
+            return
+        logging.info(f"Received {signal.Signals(signum).name}, stopping after the current cycle")
+        stop.set()
+
+    def health():
+        last_success = state['last_success_at'] or state['started_at']
+        healthy = time.time() - last_success <= DAEMON_CONFIG['stale_after']
+        return healthy, dict(state, status='ok' if healthy else 'stale')
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, request_stop, signum)
+    service = None
+    health_server = None
+    try:
+        logging.info("Starting news scraper daemon")
+        service = ScraperService()
+        if DAEMON_CONFIG['health_port']:
+            health_server = HealthServer(DAEMON_CONFIG['health_host'], DAEMON_CONFIG['health_port'], health)
+        last_trimmed = time.monotonic()
+        interval = DAEMON_CONFIG['min_interval']
+        while not stop.is_set():
+            state['last_cycle_at'] = time.time()
+            state['cycles'] += 1
+            try:
+                with metrics.timer('daemon_cycle'):
+                    new_articles = await service.run_cycle(pages)
+                metrics.increment('daemon_cycles', result='ok')
+                state['last_success_at'] = time.time()
+                state['consecutive_failures'] = 0
+                interval = DAEMON_CONFIG['min_interval'] if new_articles else interval * DAEMON_CONFIG['backoff']
+            except Exception as e:
+                logging.error(f"Scrape cycle failed: {e}")
+                logging.error(traceback.format_exc())
+                metrics.increment('daemon_cycles', result='failed')
+                state['consecutive_failures'] += 1
+                interval *= DAEMON_CONFIG['backoff']
+            interval = min(interval, DAEMON_CONFIG['max_interval'])
+            state['interval'] = interval
+            metrics.set_gauge('poll_interval_seconds', interval)
+            if time.monotonic() - last_trimmed > 86400:
+                await asyncio.to_thread(service.trim_caches)
+                last_trimmed = time.monotonic()
+            write_metrics_report()
+            logging.info(f"Next poll in {interval:.0f}s")
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(signum)
+        if health_server:
+            health_server.close()
+        if service:
+            service.close()
+        write_metrics_report()
+        logging.info("News scraper daemon stopped")
+
+def parse_rerender_parts(value):
+    parts = [part.strip() for part in value.split(',') if part.strip()]
+    unknown = [part for part in parts if part not in RERENDER_PARTS]
+    if unknown or not parts:
+        raise argparse.ArgumentTypeError(f"choose parts from {', '.join(RERENDER_PARTS)}")
+    return [part for part in RERENDER_PARTS if part in parts]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape, translate and publish current affairs articles")
+    parser.add_argument('--pages', type=int, default=SCRAPER_CONFIG['pages'],
+                        help="maximum number of listing pages to crawl")
+    parser.add_argument('--backfill', action='store_true',
+                        help="crawl every listing page up to --pages instead of stopping at the first fully scraped page")
+    parser.add_argument('--daemon', action='store_true',
+                        help="keep running and poll the listing pages on an adaptive interval until SIGTERM/SIGINT")
+    parser.add_argument('--rerender', metavar='PARTS', type=parse_rerender_parts,
+                        help=f"instead of scraping, re-derive existing tbl_news rows; comma-separated parts from {', '.join(RERENDER_PARTS)}")
+    parser.add_argument('--restart', action='store_true',
+                        help="with --rerender, ignore the saved checkpoint and start from the first row")
+    return parser.parse_args(argv)
 
 def run_scraper():
+    args = parse_args()
     try:
+        if args.rerender:
+            logging.info("Running tbl_news re-render")
+            asyncio.run(rerender_news(args.rerender, args.restart))
+            logging.info("Re-render completed successfully")
+            return
+        if args.daemon:
+            asyncio.run(run_daemon(args.pages))
+            return
         logging.info("Running scraper")
-        asyncio.run(main())
+        asyncio.run(main(args.pages, args.backfill))
         logging.info("Scraper completed successfully")
     except KeyboardInterrupt:
         logging.info("Script interrupted by user")